@@ -1,12 +1,15 @@
 from django.views import View
 from django.shortcuts import render
 from myapp.models import Inverter
+from myapp.stats import get_dashboard_stats
 
 
 class Dashboard(View):
 
     def get(self, request):
-        inverters = Inverter.objects.all()
-        inverter_count = inverters.count()
-        return render(request,"admin/dashboard.html",{"inverter": inverters, "inverter_count": inverter_count},
+        stats = get_dashboard_stats()
+        recent_inverters = Inverter.objects.only(
+            "id", "name", "brand", "model", "price", "created_at"
+        ).order_by("-created_at")[:5]
+        return render(request,"admin/dashboard.html",{"stats": stats, "inverter_count": stats["inverter_count"], "recent_inverters": recent_inverters},
         )
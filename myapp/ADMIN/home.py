@@ -4,7 +4,10 @@ from django.contrib import messages
 from django.http import JsonResponse
 from django.core.exceptions import ValidationError
 from django.db import DatabaseError, OperationalError, IntegrityError
-from myapp.models import Inverter, HomepageSlider
+from myapp.decorators import catalog_condition
+from myapp.images import delete_derivatives
+from myapp.models import Inverter, HomepageSlider, ImageStatus
+from myapp.uploads import queue_image_upload
 import json
 import logging
 
@@ -12,6 +15,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@catalog_condition(private=True)
 def homepage(request):
     """
     Handle homepage slider management with proper error handling.
@@ -108,15 +112,18 @@ def homepage(request):
 
                         try:
                             # Create slider
-                            HomepageSlider.objects.create(
+                            slider = HomepageSlider(
                                 title=title,
                                 subtitle=subtitle,
                                 description=description,
-                                image=image,
                                 cta_text=cta_text,
                                 cta_link=cta_link,
                                 cta_internal_page=cta_internal_page,
                             )
+                            slider.image_status = ImageStatus.PENDING
+                            slider.save()
+                            # Uploaded later by process_image_uploads
+                            queue_image_upload(slider, image)
                             messages.success(
                                 request,
                                 f'Slider "{title}" has been created successfully.',
@@ -192,6 +199,11 @@ def homepage(request):
                                     )
                                     # Continue with slider deletion even if image deletion fails
 
+                            delete_derivatives(
+                                slider_to_delete.image.storage,
+                                slider_to_delete.image_variants,
+                            )
+
                             # Delete slider
                             slider_to_delete.delete()
                             messages.success(
@@ -331,24 +343,14 @@ def homepage(request):
                                 slider.cta_link = cta_link
                                 slider.cta_internal_page = cta_internal_page
 
-                                # Update image if provided
+                                # The old image stays up until the new one is
+                                # uploaded, which removes it
                                 if image:
-                                    # Delete old image before replacing
-                                    if slider.image:
-                                        try:
-                                            if hasattr(slider.image, "storage"):
-                                                if slider.image.storage.exists(
-                                                    slider.image.name
-                                                ):
-                                                    slider.image.delete(save=False)
-                                        except Exception as e:
-                                            logger.warning(
-                                                f"Old image couldn't be deleted: {str(e)}"
-                                            )
-
-                                    slider.image = image
+                                    slider.image_status = ImageStatus.PENDING
 
                                 slider.save()
+                                if image:
+                                    queue_image_upload(slider, image)
                                 messages.success(
                                     request,
                                     f'Slider "{title}" has been updated successfully.',
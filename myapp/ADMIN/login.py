@@ -1,5 +1,5 @@
 from django.shortcuts import render, redirect
-from django.contrib.auth.hashers import check_password
+from django.contrib.auth.hashers import check_password, make_password
 from django.contrib import messages
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.cache import never_cache
@@ -7,7 +7,9 @@ from django.http import JsonResponse
 from django.core.exceptions import ValidationError
 from django.db import DatabaseError, OperationalError
 from myapp.models import User
+from myapp.throttle import client_ip, login_throttle
 import json
+import math
 import time
 import logging
 
@@ -15,6 +17,33 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def rehash_password(user, raw_password):
+    """
+    Re-encode a password whose stored hash doesn't match the current policy.
+    """
+    try:
+        user.password = make_password(raw_password)
+        user.save(update_fields=["password"])
+        logger.info(f"Password rehashed for user: {user.username}")
+    except Exception as e:
+        # The login itself already succeeded
+        logger.error(f"Password rehash error: {str(e)}")
+
+
+def record_login_failure(remote_addr, username):
+    try:
+        login_throttle.failure(remote_addr, username)
+    except Exception as e:
+        logger.error(f"Rate limiting error: {str(e)}")
+
+
+def record_login_success(remote_addr, username):
+    try:
+        login_throttle.success(remote_addr, username)
+    except Exception as e:
+        logger.error(f"Rate limiting error: {str(e)}")
+
+
 @csrf_protect
 @never_cache
 def loginuser(request):
@@ -52,39 +81,44 @@ def loginuser(request):
                     messages.error(request, "Password is too long.")
                     return render(request, "admin/login.html")
 
-                # Rate limiting - prevent brute force attacks
+                # Rate limiting - prevent brute force attacks. This runs
+                # before the user query and password hash, so a lockout is cheap
+                remote_addr = client_ip(request)
                 try:
-                    remote_addr = request.META.get(
-                        "HTTP_X_FORWARDED_FOR",
-                        request.META.get("REMOTE_ADDR", "unknown"),
-                    )
-                    # Get first IP if multiple (for proxies/load balancers)
-                    if "," in remote_addr:
-                        remote_addr = remote_addr.split(",")[0].strip()
-
-                    session_key = f"login_attempts_{remote_addr}"
-                    attempts = request.session.get(session_key, 0)
-
-                    if attempts >= 5:
-                        logger.warning(f"Rate limit exceeded for IP: {remote_addr}")
-                        messages.error(
-                            request,
-                            "Too many failed login attempts. Please try again in 15 minutes.",
-                        )
-                        return render(request, "admin/login.html")
+                    retry_after = login_throttle.check(remote_addr, username)
                 except Exception as e:
                     logger.error(f"Rate limiting error: {str(e)}")
                     # Continue without rate limiting if it fails
-                    session_key = None
-                    attempts = 0
+                    retry_after = 0
+
+                if retry_after:
+                    logger.warning(
+                        f"Rate limit exceeded for IP: {remote_addr} / username: {username}"
+                    )
+                    messages.error(
+                        request,
+                        "Too many failed login attempts. Please try again in "
+                        f"{max(1, math.ceil(retry_after / 60))} minutes.",
+                    )
+                    response = render(request, "admin/login.html", status=429)
+                    response["Retry-After"] = str(math.ceil(retry_after))
+                    return response
 
                 try:
-                    # Find user by username (case-insensitive)
-                    user = User.objects.get(username__iexact=username)
+                    # Find user by username (case-insensitive, index-backed)
+                    user = (
+                        User.objects.only("id", "username", "email", "password")
+                        .filter_username(username)
+                        .get()
+                    )
 
                     # Verify password
                     try:
-                        password_valid = check_password(password, user.password)
+                        password_valid = check_password(
+                            password,
+                            user.password,
+                            setter=lambda raw: rehash_password(user, raw),
+                        )
                     except Exception as e:
                         logger.error(f"Password verification error: {str(e)}")
                         messages.error(
@@ -95,9 +129,8 @@ def loginuser(request):
                     if password_valid:
                         # Successful login
                         try:
-                            # Clear failed attempts
-                            if session_key and session_key in request.session:
-                                del request.session[session_key]
+                            # Clear failed attempts for this username
+                            record_login_success(remote_addr, username)
 
                             # Create user session
                             request.session["user_id"] = user.id
@@ -140,17 +173,13 @@ def loginuser(request):
 
                     else:
                         # Wrong password
-                        if session_key:
-                            request.session[session_key] = attempts + 1
-                            request.session.modified = True
+                        record_login_failure(remote_addr, username)
                         logger.warning(f"Failed login attempt for username: {username}")
                         messages.error(request, "Invalid username or password.")
 
                 except User.DoesNotExist:
                     # User not found
-                    if session_key:
-                        request.session[session_key] = attempts + 1
-                        request.session.modified = True
+                    record_login_failure(remote_addr, username)
                     logger.warning(f"Login attempt for non-existent user: {username}")
                     messages.error(request, "Invalid username or password.")
 
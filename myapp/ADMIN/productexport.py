@@ -0,0 +1,94 @@
+import csv
+import json
+import logging
+
+from django.contrib import messages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.shortcuts import redirect
+from django.utils import timezone
+from django.views import View
+from myapp.API.filters import filter_inverters
+from myapp.API.serializers import InverterSearchParamsSerializer
+from myapp.catalog_import import IMPORT_FIELDS
+from myapp.models import Inverter
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Import columns first, so an export can be fed straight back into an import
+EXPORT_FIELDS = ["id", *IMPORT_FIELDS, "created_at", "updated_at"]
+
+
+class Echo:
+    """
+    File-like object whose write() hands the line back instead of buffering it.
+    """
+
+    def write(self, value):
+        return value
+
+
+class ProductExport(View):
+    """
+    Stream the catalog as CSV or JSONL, filtered like the search API.
+
+    Rows come from a server-side cursor in ``chunk_size`` batches and are
+    written out as they arrive, so memory stays flat whatever the row count.
+    No transaction is held open while a slow client downloads: under
+    autocommit Django declares the cursor WITH HOLD.
+    """
+
+    chunk_size = 2000
+    formats = {
+        "csv": "text/csv; charset=utf-8",
+        "jsonl": "application/x-ndjson; charset=utf-8",
+    }
+
+    def get(self, request):
+        fmt = request.GET.get("format", "csv")
+        if fmt not in self.formats:
+            messages.error(request, "Export format must be csv or jsonl.")
+            return redirect("products")
+
+        params_serializer = InverterSearchParamsSerializer(data=request.GET)
+        if not params_serializer.is_valid():
+            messages.error(request, f"Invalid export filters: {params_serializer.errors}")
+            return redirect("products")
+
+        queryset = filter_inverters(Inverter.objects.all(), params_serializer.validated_data)
+        rows = queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=self.chunk_size)
+
+        stream = self.stream_csv(rows) if fmt == "csv" else self.stream_jsonl(rows)
+        response = StreamingHttpResponse(stream, content_type=self.formats[fmt])
+        filename = f"catalog-{timezone.now():%Y%m%d-%H%M%S}.{fmt}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["Cache-Control"] = "private, no-store"
+        return response
+
+    def stream_csv(self, rows):
+        writer = csv.writer(Echo())
+        # Header goes out before the query runs
+        yield writer.writerow(EXPORT_FIELDS)
+        chunk = []
+        for row in rows:
+            chunk.append(writer.writerow(row))
+            if len(chunk) >= self.chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
+
+    def stream_jsonl(self, rows):
+        chunk = []
+        for index, row in enumerate(rows):
+            chunk.append(
+                json.dumps(dict(zip(EXPORT_FIELDS, row)), cls=DjangoJSONEncoder) + "\n"
+            )
+            # Like the CSV header, the first row goes out at once so the
+            # download starts before a whole chunk is buffered
+            if index == 0 or len(chunk) >= self.chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
@@ -0,0 +1,66 @@
+import io
+import logging
+
+from django.conf import settings
+from django.views import View
+from django.shortcuts import redirect
+from django.contrib import messages
+from django.template.defaultfilters import filesizeformat
+from myapp.catalog_import import CatalogImporter, detect_format
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class ProductImport(View):
+    """
+    Upload a supplier CSV/JSONL file and upsert it into the catalog.
+
+    The import runs in the request, so uploads are capped at
+    CATALOG_IMPORT_MAX_UPLOAD_SIZE; bigger files go through the
+    ``import_catalog`` command.
+    """
+
+    max_reported_errors = 10
+
+    def post(self, request):
+        upload = request.FILES.get("catalog_file")
+        if not upload:
+            messages.error(request, "Please choose a CSV or JSONL file to import.")
+            return redirect("products")
+
+        max_size = settings.CATALOG_IMPORT_MAX_UPLOAD_SIZE
+        if upload.size > max_size:
+            messages.error(
+                request,
+                f"Files over {filesizeformat(max_size)} can't be imported here; "
+                "use the import_catalog management command instead.",
+            )
+            return redirect("products")
+
+        dry_run = bool(request.POST.get("dry_run"))
+        importer = CatalogImporter(dry_run=dry_run)
+
+        try:
+            # Large uploads are spooled to disk, so this streams from the temp file
+            stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+            report = importer.run(stream, detect_format(upload.name))
+        except UnicodeDecodeError:
+            messages.error(request, "The file must be UTF-8 encoded.")
+            return redirect("products")
+        except Exception as e:
+            logger.error(f"Error importing catalog file {upload.name}: {str(e)}")
+            messages.error(request, f"Error importing catalog: {str(e)}")
+            return redirect("products")
+
+        for line_number, errors in report.errors[: self.max_reported_errors]:
+            messages.warning(request, f"Line {line_number}: {' '.join(errors)}")
+        if report.error_count > self.max_reported_errors:
+            messages.warning(
+                request,
+                f"{report.error_count - self.max_reported_errors} more rows had errors.",
+            )
+
+        prefix = "Dry run: " if dry_run else "Import complete: "
+        messages.success(request, prefix + report.summary())
+        return redirect("products")
@@ -1,15 +1,71 @@
 from django.views import View
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db import IntegrityError
+from django.db.models.functions import Left
 from django.http import JsonResponse
-from myapp.models import Inverter
+from django.utils.decorators import method_decorator
+from myapp.decorators import catalog_condition
+from myapp.models import ImageStatus, Inverter
+from myapp.uploads import queue_image_upload
+from myapp.validation import validate_inverter_data
 import json
 
 
+# Columns shown in the products table; edit forms are fetched per row
+LIST_COLUMNS = [
+    "id",
+    "name",
+    "brand",
+    "model",
+    "power_capacity_kw",
+    "input_voltage",
+    "output_voltage",
+    "price",
+    "thumbnail_url",
+    "image_status",
+]
+
+
+DUPLICATE_MESSAGE = "An inverter with this brand and model already exists."
+
+SORT_FIELDS = {
+    "name": "name",
+    "brand": "brand",
+    "model": "model",
+    "power": "power_capacity_kw",
+    "price": "price",
+    "created": "created_at",
+}
+
+
 class Products(View):
+    per_page = 25
+    default_sort = "-created"
+
+    def get_sort(self, request):
+        sort = request.GET.get("sort", self.default_sort)
+        if sort.lstrip("-") not in SORT_FIELDS:
+            sort = self.default_sort
+        return sort
+
+    def get_context(self, request):
+        sort = self.get_sort(request)
+        field = SORT_FIELDS[sort.lstrip("-")]
+        direction = "-" if sort.startswith("-") else ""
+
+        inverters = (
+            Inverter.objects.only(*LIST_COLUMNS)
+            .annotate(description_preview=Left("description", 120))
+            .order_by(f"{direction}{field}", f"{direction}id")
+        )
+        page = Paginator(inverters, self.per_page).get_page(request.GET.get("page"))
+        return {"inverters": page, "page_obj": page, "sort": sort}
+
+    @method_decorator(catalog_condition(private=True))
     def get(self, request):
-        inverters = Inverter.objects.all()
-        return render(request, "admin/products.html", {"inverters": inverters})
+        return render(request, "admin/products.html", self.get_context(request))
 
     def post(self, request):
         if request.POST.get("delete_id"):
@@ -21,40 +77,10 @@ class Products(View):
 
         return self.create_inverter(request)
 
-    def validate_input(self, data, files):
-        errors = []
-
-        required_fields = [
-            "name",
-            "brand",
-            "model",
-            "power_capacity_kw",
-            "input_voltage",
-            "output_voltage",
-            "price",
-            "description",
-        ]
-
-        for field in required_fields:
-            if not data.get(field):
-                errors.append(f"{field.replace('_', ' ').title()} is required.")
-
-        # Check numeric fields
-        for num_field in ["price", "power_capacity_kw"]:
-            try:
-                float(data.get(num_field))
-            except (ValueError, TypeError):
-                errors.append(
-                    f"{num_field.replace('_', ' ').title()} must be a number."
-                )
-
-        # Validate image (optional)
-        image = files.get("image")
-        if image:
-            if image.size > 5 * 1024 * 1024:  # 5MB max
-                errors.append("Image size must be less than 5MB.")
-
-        return errors
+    def validate_input(self, data, files, instance_id=None):
+        return validate_inverter_data(
+            data, files, check_unique=True, instance_id=instance_id
+        )
 
     def create_inverter(self, request):
         errors = self.validate_input(request.POST, request.FILES)
@@ -62,12 +88,10 @@ class Products(View):
         if errors:
             for error in errors:
                 messages.error(request, error)
-            return render(
-                request, "admin/products.html", {"inverters": Inverter.objects.all()}
-            )
+            return render(request, "admin/products.html", self.get_context(request))
 
         try:
-            Inverter.objects.create(
+            inverter = Inverter(
                 name=request.POST.get("name"),
                 brand=request.POST.get("brand"),
                 model=request.POST.get("model"),
@@ -75,22 +99,31 @@ class Products(View):
                 input_voltage=request.POST.get("input_voltage"),
                 output_voltage=request.POST.get("output_voltage"),
                 price=request.POST.get("price"),
-                image=request.FILES.get("image"),
                 description=request.POST.get("description"),
             )
+            image = request.FILES.get("image")
+            if image:
+                inverter.image_status = ImageStatus.PENDING
+            inverter.save()
+            if image:
+                # Uploaded later by process_image_uploads
+                queue_image_upload(inverter, image)
             messages.success(request, "Inverter created successfully!")
             return redirect("products")
 
+        except IntegrityError:
+            # Another request added the same brand and model since validation
+            messages.error(request, DUPLICATE_MESSAGE)
+            return render(request, "admin/products.html", self.get_context(request))
+
         except Exception as e:
             messages.error(request, f"Error creating inverter: {str(e)}")
-            return render(
-                request, "admin/products.html", {"inverters": Inverter.objects.all()}
-            )
+            return render(request, "admin/products.html", self.get_context(request))
 
     def update_inverter(self, request, inverter_id):
         inverter = get_object_or_404(Inverter, id=inverter_id)
 
-        errors = self.validate_input(request.POST, request.FILES)
+        errors = self.validate_input(request.POST, request.FILES, inverter.id)
 
         if errors:
             for error in errors:
@@ -113,13 +146,20 @@ class Products(View):
             inverter.price = request.POST.get("price", inverter.price)
             inverter.description = request.POST.get("description", inverter.description)
 
-            if request.FILES.get("image"):
-                inverter.image = request.FILES.get("image")
+            image = request.FILES.get("image")
+            if image:
+                inverter.image_status = ImageStatus.PENDING
 
             inverter.save()
+            if image:
+                queue_image_upload(inverter, image)
             messages.success(request, "Inverter updated successfully!")
             return redirect("products")
 
+        except IntegrityError:
+            messages.error(request, DUPLICATE_MESSAGE)
+            return redirect("products")
+
         except Exception as e:
             messages.error(request, f"Error updating inverter: {str(e)}")
             return redirect("products")
@@ -135,3 +175,26 @@ class Products(View):
         except Exception as e:
             messages.error(request, f"Error deleting inverter: {str(e)}")
         return redirect("products")
+
+
+class ProductDetail(View):
+    """
+    Return one inverter's edit form data when its modal opens.
+    """
+
+    def get(self, request, id):
+        inverter = get_object_or_404(Inverter.objects.defer("search_vector"), id=id)
+        return JsonResponse(
+            {
+                "id": inverter.id,
+                "name": inverter.name,
+                "brand": inverter.brand,
+                "model": inverter.model,
+                "power_capacity_kw": inverter.power_capacity_kw,
+                "input_voltage": inverter.input_voltage,
+                "output_voltage": inverter.output_voltage,
+                "price": str(inverter.price),
+                "description": inverter.description,
+                "image": inverter.image_url,
+            }
+        )
@@ -35,11 +35,11 @@ def registeruser(request):
             errors.append("Passwords do not match.")
 
         # Check if username already exists
-        if username and User.objects.filter(username=username).exists():
+        if username and User.objects.filter_username(username).exists():
             errors.append("Username already exists. Please choose a different one.")
 
         # Check if email already exists
-        if email and User.objects.filter(email=email).exists():
+        if email and User.objects.filter_email(email).exists():
             errors.append("Email already registered. Please use a different email.")
 
         # If no errors, create the user
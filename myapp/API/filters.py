@@ -0,0 +1,52 @@
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F, Q
+from django.db.models.functions import Upper
+
+
+def filter_inverter_ranges(queryset, params):
+    """
+    Apply the power/price range filters from validated search params.
+    """
+    if "power_min" in params:
+        queryset = queryset.filter(power_capacity_kw__gte=params["power_min"])
+    if "power_max" in params:
+        queryset = queryset.filter(power_capacity_kw__lte=params["power_max"])
+    if "price_min" in params:
+        queryset = queryset.filter(price__gte=params["price_min"])
+    if "price_max" in params:
+        queryset = queryset.filter(price__lte=params["price_max"])
+    return queryset
+
+
+def filter_inverter_text(queryset, text):
+    """
+    Match ``text`` against the search vector and annotate a ``rank``.
+    """
+    query = SearchQuery(text, search_type="websearch", config="english")
+    # Full-text match on the GIN-indexed vector, trigram match for typos.
+    # Trigrams ignore case, so matching on UPPER() uses the same indexes as
+    # the admin's icontains search
+    return queryset.filter(
+        Q(search_vector=query)
+        | TrigramSimilar(Upper("name"), text)
+        | TrigramSimilar(Upper("model"), text)
+    ).annotate(
+        rank=SearchRank(F("search_vector"), query) + TrigramSimilarity("name", text)
+    )
+
+
+def filter_inverters(queryset, params):
+    """
+    Apply every catalog search filter and the matching sort order.
+    """
+    queryset = filter_inverter_ranges(queryset, params)
+    text = params.get("q", "").strip()
+    if text:
+        queryset = filter_inverter_text(queryset, text)
+    brands = params.get("brand")
+    if brands:
+        queryset = queryset.filter(brand__in=brands)
+    if text:
+        return queryset.order_by("-rank", "-created_at", "-id")
+    return queryset.order_by("-created_at", "-id")
@@ -0,0 +1,77 @@
+from django.db.models import Count
+from rest_framework import generics
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from myapp.API.filters import filter_inverters
+from myapp.API.pagination import KeysetPagination
+from myapp.API.serializers import InverterSerializer, InverterSearchParamsSerializer
+from myapp.models import Inverter
+
+
+class InverterAPIMixin:
+    """
+    Shared setup for the public, read-only inverter endpoints.
+    """
+
+    serializer_class = InverterSerializer
+    renderer_classes = [JSONRenderer]
+    # Public catalog: no session or basic auth lookup per request
+    authentication_classes = []
+    fields_query_param = "fields"
+
+    def get_requested_fields(self):
+        raw = self.request.query_params.get(self.fields_query_param, "")
+        return [name.strip() for name in raw.split(",") if name.strip()]
+
+    def get_queryset(self):
+        queryset = Inverter.objects.defer("search_vector")
+        fields = self.get_requested_fields()
+        if fields:
+            columns = InverterSerializer.model_fields_for(fields)
+            # The pagination cursor always needs the sort key
+            queryset = queryset.only("id", "created_at", *columns)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+
+class InverterList(InverterAPIMixin, generics.ListAPIView):
+    pagination_class = KeysetPagination
+
+
+class InverterDetail(InverterAPIMixin, generics.RetrieveAPIView):
+    pass
+
+
+class InverterSearch(InverterAPIMixin, generics.GenericAPIView):
+    """
+    Ranked text search with brand/power/price filters and brand facet counts.
+    """
+
+    default_page_size = 50
+
+    def get(self, request):
+        params_serializer = InverterSearchParamsSerializer(data=request.query_params)
+        params_serializer.is_valid(raise_exception=True)
+        params = params_serializer.validated_data
+
+        queryset = filter_inverters(self.get_queryset(), params)
+
+        # Facets ignore the brand filter so the client can show every option
+        facets = list(
+            filter_inverters(self.get_queryset(), {**params, "brand": None})
+            .order_by()
+            .values("brand")
+            .annotate(count=Count("id"))
+            .order_by("-count", "brand")
+        )
+        brands = params.get("brand")
+        count = sum(f["count"] for f in facets if not brands or f["brand"] in brands)
+
+        page_size = params.get("page_size", self.default_page_size)
+        serializer = self.get_serializer(queryset[:page_size], many=True)
+        return Response(
+            {"count": count, "facets": {"brand": facets}, "results": serializer.data}
+        )
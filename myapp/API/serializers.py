@@ -0,0 +1,71 @@
+from rest_framework import serializers
+from myapp.models import Inverter
+
+
+class SparseFieldsMixin:
+    """
+    Serializer mixin that keeps only the fields named in ``fields``.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def model_fields_for(cls, fields):
+        """
+        Map API field names to the model columns needed to render them.
+        """
+        declared = cls().fields
+        columns = []
+        for name in fields:
+            if name not in declared:
+                continue
+            source = declared[name].source
+            # Method fields read the model column of the same name
+            columns.append(name if source == "*" else source)
+        return columns
+
+
+class InverterSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    # Same short keys as the storefront products_json
+    power = serializers.FloatField(source="power_capacity_kw")
+    input = serializers.CharField(source="input_voltage")
+    output = serializers.CharField(source="output_voltage")
+    price = serializers.FloatField()
+    image = serializers.CharField(source="image_url")
+
+    class Meta:
+        model = Inverter
+        fields = [
+            "id",
+            "name",
+            "brand",
+            "model",
+            "power",
+            "input",
+            "output",
+            "price",
+            "description",
+            "image",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
+class InverterSearchParamsSerializer(serializers.Serializer):
+    """
+    Validates the query string of the inverter search endpoint.
+    """
+
+    q = serializers.CharField(required=False, allow_blank=True, max_length=200)
+    brand = serializers.ListField(
+        child=serializers.CharField(max_length=100), required=False
+    )
+    power_min = serializers.FloatField(required=False)
+    power_max = serializers.FloatField(required=False)
+    price_min = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
+    price_max = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
+    page_size = serializers.IntegerField(required=False, min_value=1, max_value=200)
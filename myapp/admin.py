@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import Inverter
+from .models import ImageStatus, Inverter
 
 
 @admin.register(Inverter)
@@ -27,13 +27,27 @@ class InverterAdmin(admin.ModelAdmin):
     )
     
     def image_preview(self, obj):
-        if obj.image:
+        if obj.thumbnail_url:
             return format_html(
                 '<img src="{}" width="50" height="50" style="border-radius: 5px;" />',
-                obj.image.url
+                obj.thumbnail_url
             )
         return "No Image"
     image_preview.short_description = "Preview"
+
+    def save_model(self, request, obj, form, change):
+        # The uploader isn't needed to serve pages, so it's not imported at startup
+        from .uploads import queue_image_upload
+
+        # New uploads go through the same queue as the products page, which
+        # stores the file and its derivatives outside the request
+        upload = form.cleaned_data.get("image") if "image" in form.changed_data else None
+        if upload:
+            obj.image = form.initial.get("image")
+            obj.image_status = ImageStatus.PENDING
+        super().save_model(request, obj, form, change)
+        if upload:
+            queue_image_upload(obj, upload)
     
     def actions_column(self, obj):
         return format_html(
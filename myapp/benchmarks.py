@@ -0,0 +1,230 @@
+"""
+Latency and throughput benchmarks for the storefront, admin and login flows.
+
+Each scenario drives the full middleware stack in-process through the test
+client, from ``concurrency`` threads with one client (and one database
+connection) each. ``run`` returns a JSON-ready dict of per-route
+percentiles; ``compare`` checks it against a saved baseline.
+"""
+
+import secrets
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connections
+from django.test import Client
+from django.utils.module_loading import import_string
+from myapp.models import Inverter, User
+
+BENCHMARK_PREFIX = "benchmark-"
+
+
+class Scenario:
+    method = "get"
+    path = "/"
+    expected_status = 200
+    authenticated = False
+
+    def __init__(self, name):
+        self.name = name
+
+    def setup(self):
+        pass
+
+    def teardown(self):
+        pass
+
+    def data(self, worker, sequence):
+        return None
+
+    def prepare(self, client):
+        pass
+
+    def request(self, client, worker, sequence):
+        self.prepare(client)
+        send = getattr(client, self.method)
+        return send(self.path, self.data(worker, sequence))
+
+
+class Storefront(Scenario):
+    path = "/"
+
+
+class ProductList(Scenario):
+    path = "/products/"
+    authenticated = True
+
+
+class ProductCreate(Scenario):
+    method = "post"
+    path = "/products/"
+    expected_status = 302
+    authenticated = True
+
+    def data(self, worker, sequence):
+        return {
+            "name": f"{BENCHMARK_PREFIX}{worker}-{sequence}",
+            "brand": "Benchmark",
+            "model": f"BM-{worker}-{sequence}",
+            "power_capacity_kw": "5",
+            "input_voltage": "48V",
+            "output_voltage": "230V",
+            "price": "1000",
+            "description": "Created by the benchmark suite.",
+        }
+
+    def teardown(self):
+        Inverter.objects.filter(name__startswith=BENCHMARK_PREFIX).delete()
+
+
+class SliderAdmin(Scenario):
+    path = "/slider/"
+    authenticated = True
+
+
+class Login(Scenario):
+    method = "post"
+    path = "/login/"
+    expected_status = 302
+
+    def setup(self):
+        self.username = f"{BENCHMARK_PREFIX}{secrets.token_hex(4)}"
+        self.password = secrets.token_urlsafe(16)
+        User.objects.create(
+            username=self.username,
+            email=f"{self.username}@example.com",
+            password=make_password(self.password),
+        )
+
+    def teardown(self):
+        User.objects.filter_username(self.username).delete()
+
+    def prepare(self, client):
+        # A logged-in session is redirected before the password check
+        client.cookies.clear()
+
+    def data(self, worker, sequence):
+        return {"username": self.username, "password": self.password}
+
+
+SCENARIOS = {
+    "storefront": Storefront,
+    "products-list": ProductList,
+    "products-create": ProductCreate,
+    "slider-admin": SliderAdmin,
+    "login": Login,
+}
+
+
+def authenticate(client):
+    engine = import_string(f"{settings.SESSION_ENGINE}.SessionStore")
+    session = engine()
+    session["user_id"] = 0
+    session["username"] = "benchmark"
+    session["email"] = "benchmark@example.com"
+    session["login_time"] = int(time.time())
+    session["is_authenticated"] = True
+    session.save()
+    client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_scenario(scenario, requests, concurrency, warmup=3, host="localhost"):
+    """
+    Send ``requests`` requests per worker and summarize the latencies.
+    """
+    timings = []
+    errors = []
+    lock = threading.Lock()
+    start_gate = threading.Barrier(concurrency)
+
+    def worker(index):
+        client = Client(HTTP_HOST=host)
+        try:
+            try:
+                if scenario.authenticated:
+                    authenticate(client)
+                for sequence in range(warmup):
+                    scenario.request(client, index, f"warmup-{sequence}")
+            except Exception:
+                # Release the other workers instead of leaving them waiting
+                start_gate.abort()
+                raise
+            start_gate.wait()
+            local = []
+            for sequence in range(requests):
+                started = time.perf_counter()
+                response = scenario.request(client, index, sequence)
+                local.append(time.perf_counter() - started)
+                if response.status_code != scenario.expected_status:
+                    with lock:
+                        errors.append(response.status_code)
+            with lock:
+                timings.extend(local)
+        finally:
+            connections.close_all()
+
+    scenario.setup()
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            # Propagate worker exceptions
+            list(pool.map(worker, range(concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        scenario.teardown()
+
+    timings.sort()
+    return {
+        "requests": len(timings),
+        "errors": len(errors),
+        "throughput_rps": round(len(timings) / elapsed, 1),
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(timings, 0.99) * 1000, 2),
+    }
+
+
+def run(names, requests, concurrency, host="localhost"):
+    return {
+        "requests_per_worker": requests,
+        "concurrency": concurrency,
+        "database": settings.DATABASES["default"]["ENGINE"],
+        "cache": settings.CACHES["default"]["BACKEND"],
+        "session_engine": settings.SESSION_ENGINE,
+        "routes": {
+            name: run_scenario(SCENARIOS[name](name), requests, concurrency, host=host)
+            for name in names
+        },
+    }
+
+
+def compare(results, baseline, budget, slack_ms=2.0):
+    """
+    Return a list of regressions, one message per route that had errors or
+    whose p95 rose more than ``budget`` (a fraction) above the baseline.
+
+    Rises under ``slack_ms`` are ignored, since scheduler noise alone can
+    double a sub-millisecond p95.
+    """
+    regressions = []
+    for name, current in results["routes"].items():
+        if current["errors"]:
+            regressions.append(f"{name}: {current['errors']} unexpected responses")
+        previous = baseline.get("routes", {}).get(name)
+        if not previous:
+            continue
+        limit = max(previous["p95_ms"] * (1 + budget), previous["p95_ms"] + slack_ms)
+        if current["p95_ms"] > limit:
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']:.2f} ms exceeds "
+                f"the {limit:.2f} ms budget ({previous['p95_ms']:.2f} ms baseline)"
+            )
+    return regressions
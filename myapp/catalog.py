@@ -0,0 +1,141 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.template.defaultfilters import floatformat
+from myapp.images import image_sources
+from myapp.models import Inverter, HomepageSlider
+
+
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+def get_catalog_version():
+    """
+    Return the current catalog version, creating it if the cache is empty.
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # Seed from the clock so a version lost to eviction or a restart
+        # never collides with payloads cached under an older number.
+        cache.add(CATALOG_VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    """
+    Invalidate every payload cached under the current catalog version.
+    """
+    try:
+        return cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        return get_catalog_version()
+
+
+def catalog_cache_key(name, version=None):
+    if version is None:
+        version = get_catalog_version()
+    # Entries built by another release's code are never reused
+    return f"catalog:{settings.RELEASE}:{name}:{version}"
+
+
+# Columns of the storefront product payload, in order. Descriptions are left
+# out; the product modal fetches one from the API when it opens.
+STOREFRONT_COLUMNS = {
+    "id": "id",
+    "name": "name",
+    "brand": "brand",
+    "model": "model",
+    "power": "power_capacity_kw",
+    "input": "input_voltage",
+    "output": "output_voltage",
+    "price": "price",
+    "icon": "icon",
+}
+
+
+def build_storefront_payload():
+    # Slides whose first upload is still in flight have no image to show yet
+    sliders = list(HomepageSlider.objects.exclude(image="").order_by("-created_at"))
+
+    # Build srcsets now so they are cached along with the instances
+    for slider in sliders:
+        slider.responsive_image
+
+    # One array per column instead of one object per product, so key names
+    # are sent once rather than once per row
+    columns = {
+        key: [] for key in [*STOREFRONT_COLUMNS, "price_label", "image", "webp", "jpeg"]
+    }
+    # Image URLs are stored on the rows, so no storage backend calls here
+    rows = Inverter.objects.order_by("-created_at").values_list(
+        *STOREFRONT_COLUMNS.values(), "image_url", "image_variants"
+    )
+    for row in rows:
+        for key, value in zip(STOREFRONT_COLUMNS, row):
+            columns[key].append(value)
+        sources = image_sources(row[-2], row[-1])
+        columns["image"].append(sources["src"])
+        columns["webp"].append(sources["webp"])
+        columns["jpeg"].append(sources["jpeg"])
+    columns["power"] = [float(power) for power in columns["power"]]
+    # Card prices are rounded here exactly as the server-rendered grid did;
+    # the modal floors the raw price
+    columns["price_label"] = [floatformat(price, 0) for price in columns["price"]]
+    columns["price"] = [float(price) for price in columns["price"]]
+
+    return {
+        "sliders": sliders,
+        # Escaped "<" keeps a "</script>" in a product name from ending the tag
+        "products_json": json.dumps(
+            columns, ensure_ascii=False, separators=(",", ":")
+        ).replace("<", "\\u003c"),
+    }
+
+
+def get_storefront_payload():
+    """
+    Return the storefront context, rebuilding it only after the catalog changed.
+    """
+    key = catalog_cache_key("storefront")
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_storefront_payload()
+        cache.set(key, payload, settings.CATALOG_CACHE_TIMEOUT)
+    return payload
+
+
+def build_catalog_state():
+    inverters = Inverter.objects.aggregate(last=Max("updated_at"), count=Count("id"))
+    sliders = HomepageSlider.objects.aggregate(last=Max("updated_at"), count=Count("id"))
+
+    # Pages from a new deploy may differ even if the catalog didn't change
+    stamps = [inverters["last"], sliders["last"], settings.RELEASE_TIME]
+    last_modified = max(stamp for stamp in stamps if stamp)
+    # Row counts catch deletes, which don't move max(updated_at)
+    fingerprint = "{}:{}:{}:{}".format(
+        settings.RELEASE,
+        inverters["count"],
+        sliders["count"],
+        last_modified.isoformat(),
+    )
+    return {
+        "last_modified": last_modified,
+        "etag": hashlib.md5(fingerprint.encode()).hexdigest(),
+    }
+
+
+def get_catalog_state():
+    """
+    Return the catalog's Last-Modified timestamp and ETag, cached per version.
+    """
+    key = catalog_cache_key("state")
+    state = cache.get(key)
+    if state is None:
+        state = build_catalog_state()
+        cache.set(key, state, settings.CATALOG_CACHE_TIMEOUT)
+    return state
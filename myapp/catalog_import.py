@@ -0,0 +1,199 @@
+import csv
+import json
+import logging
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.db import DatabaseError
+from myapp.catalog import bump_catalog_version
+from myapp.models import Inverter, product_icon
+from myapp.stats import refresh_brand_summaries
+from myapp.validation import validate_inverter_data
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FIELDS = [
+    "name",
+    "brand",
+    "model",
+    "power_capacity_kw",
+    "input_voltage",
+    "output_voltage",
+    "price",
+    "description",
+]
+
+UPDATE_FIELDS = [
+    "name",
+    "power_capacity_kw",
+    "input_voltage",
+    "output_voltage",
+    "price",
+    "description",
+    "icon",
+    "updated_at",
+]
+
+
+def detect_format(filename):
+    name = (filename or "").lower()
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "csv"
+
+
+def read_rows(stream, fmt):
+    """
+    Yield (line_number, row_dict) pairs from a CSV or JSONL text stream.
+    """
+    if fmt == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, e
+                continue
+            if not isinstance(row, dict):
+                yield line_number, ValueError("Row must be a JSON object.")
+                continue
+            yield line_number, row
+    else:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+
+
+class ImportReport:
+    """
+    Running totals and a bounded list of row errors for one import.
+    """
+
+    def __init__(self, max_errors=1000):
+        self.max_errors = max_errors
+        self.rows = 0
+        self.valid = 0
+        self.written = 0
+        self.batches = 0
+        self.error_count = 0
+        self.errors = []
+        self.brands = set()
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    def add_error(self, line_number, messages):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_number, messages))
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return (
+            f"{self.rows} rows read, {self.valid} valid, {self.written} written "
+            f"in {self.batches} batches, {self.error_count} errors, "
+            f"{self.elapsed:.1f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+
+
+class CatalogImporter:
+    """
+    Stream supplier rows into Inverter with batched upserts on (brand, model).
+
+    Memory stays bounded by ``batch_size``: rows are validated one at a time
+    with the same rules as the admin form and written with
+    ``bulk_create(update_conflicts=True)``. Brand summaries and the catalog
+    version are refreshed once at the end, since bulk writes bypass model
+    signals; search vectors are kept current by a database trigger.
+    """
+
+    def __init__(self, batch_size=1000, dry_run=False, max_errors=1000):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.max_errors = max_errors
+
+    def clean_row(self, row):
+        data = {
+            field: str(row.get(field) or "").strip() for field in IMPORT_FIELDS
+        }
+        errors = validate_inverter_data(data)
+        for field in IMPORT_FIELDS:
+            max_length = Inverter._meta.get_field(field).max_length
+            if max_length and len(data[field]) > max_length:
+                errors.append(
+                    f"{field.replace('_', ' ').title()} must be at most {max_length} characters."
+                )
+        if errors:
+            return None, errors
+        try:
+            price = Decimal(data["price"]).quantize(Decimal("0.01"))
+        except InvalidOperation:
+            return None, ["Price must be a number."]
+        if not price.is_finite() or price.adjusted() >= 8:
+            return None, ["Price is out of range."]
+        data["price"] = price
+        data["power_capacity_kw"] = float(data["power_capacity_kw"])
+        return data, []
+
+    def run(self, stream, fmt="csv"):
+        report = ImportReport(max_errors=self.max_errors)
+        batch = {}
+
+        for line_number, row in read_rows(stream, fmt):
+            report.rows += 1
+            if isinstance(row, Exception):
+                report.add_error(line_number, [f"Invalid row: {row}"])
+                continue
+
+            data, errors = self.clean_row(row)
+            if errors:
+                report.add_error(line_number, errors)
+                continue
+
+            report.valid += 1
+            # Later rows for the same product win, as a single
+            # INSERT ... ON CONFLICT can't touch a row twice
+            batch[(data["brand"], data["model"])] = (line_number, data)
+            if len(batch) >= self.batch_size:
+                self.write_batch(batch, report)
+                batch = {}
+
+        if batch:
+            self.write_batch(batch, report)
+
+        if not self.dry_run and report.written:
+            self.finish(report)
+
+        report.elapsed = time.monotonic() - report.started
+        logger.info(f"Catalog import finished: {report.summary()}")
+        return report
+
+    def write_batch(self, batch, report):
+        report.batches += 1
+        report.brands.update(brand for brand, _ in batch)
+        if self.dry_run:
+            return
+        try:
+            Inverter.objects.bulk_create(
+                [
+                    Inverter(icon=product_icon(data["name"]), **data)
+                    for _, data in batch.values()
+                ],
+                update_conflicts=True,
+                unique_fields=["brand", "model"],
+                update_fields=UPDATE_FIELDS,
+            )
+        except DatabaseError as e:
+            logger.error(f"Catalog import batch {report.batches} failed: {str(e)}")
+            for line_number, _ in batch.values():
+                report.add_error(line_number, [f"Batch write failed: {e}"])
+            return
+        report.written += len(batch)
+
+    def finish(self, report):
+        refresh_brand_summaries(report.brands)
+        bump_catalog_version()
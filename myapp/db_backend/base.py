@@ -0,0 +1,162 @@
+import logging
+import queue
+import threading
+import time
+
+import psycopg2
+from django.db.backends.postgresql import base, creation
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """
+    Process-local stack of idle connections, shared by every thread.
+
+    Connections idle for longer than ``health_check_after`` seconds are
+    pinged before reuse; broken ones are dropped and replaced.
+    """
+
+    def __init__(self, max_idle=4, health_check_after=30):
+        self.idle = queue.LifoQueue(maxsize=max_idle)
+        self.health_check_after = health_check_after
+
+    def get(self):
+        while True:
+            try:
+                connection, returned_at = self.idle.get_nowait()
+            except queue.Empty:
+                return None
+            if self.is_usable(connection, returned_at):
+                return connection
+            logger.info("Dropping a broken pooled database connection")
+            self.discard(connection)
+
+    def put(self, connection):
+        if connection.closed:
+            return
+        try:
+            if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+            self.idle.put_nowait((connection, time.monotonic()))
+        except (queue.Full, psycopg2.Error):
+            self.discard(connection)
+
+    def is_usable(self, connection, returned_at):
+        if connection.closed:
+            return False
+        if time.monotonic() - returned_at < self.health_check_after:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def discard(self, connection):
+        try:
+            connection.close()
+        except psycopg2.Error:
+            pass
+
+    def close_all(self):
+        while True:
+            try:
+                connection, _ = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            self.discard(connection)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def close_pooled_connections():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_all()
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Idle pooled connections would keep the test database open
+        close_pooled_connections()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend that times connection setup and can pool connections.
+
+    ``connect_time``/``connect_count`` add up the cost of opening
+    connections (see DatabaseTimingMiddleware). Setting ``POOL`` in the
+    database settings, e.g. ``{"max_idle": 4}``, makes ``close()`` hand the
+    connection back to an in-process pool instead of closing it.
+    """
+
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connect_time = 0.0
+        self.connect_count = 0
+
+    @property
+    def pool(self):
+        options = self.settings_dict.get("POOL")
+        if not options:
+            return None
+        # Tests switch NAME to the test database, so it's part of the key
+        key = (
+            self.alias,
+            self.settings_dict["HOST"],
+            self.settings_dict["USER"],
+            self.settings_dict["NAME"],
+        )
+        with _pools_lock:
+            if key not in _pools:
+                _pools[key] = ConnectionPool(**options)
+            return _pools[key]
+
+    def get_new_connection(self, conn_params):
+        started = time.perf_counter()
+        try:
+            pool = self.pool
+            connection = pool.get() if pool else None
+            if connection is None:
+                return super().get_new_connection(conn_params)
+            self.isolation_level = IsolationLevel(
+                self.settings_dict["OPTIONS"].get(
+                    "isolation_level", IsolationLevel.READ_COMMITTED
+                )
+            )
+            return connection
+        finally:
+            self.connect_time += time.perf_counter() - started
+            self.connect_count += 1
+
+    def _close(self):
+        pool = self.pool
+        if pool is None or self.connection is None:
+            return super()._close()
+        if self.errors_occurred or not self.is_pool_safe():
+            # close_if_unusable_or_obsolete() clears errors_occurred once a
+            # ping succeeds, so a flag still set here means the connection
+            # failed that check (or was never checked); don't hand it on
+            logger.info("Discarding a database connection instead of pooling it")
+            pool.discard(self.connection)
+            return
+        with self.wrap_database_errors:
+            pool.put(self.connection)
+
+    def is_pool_safe(self):
+        # Local checks only, so returning a healthy connection costs no round trip
+        connection = self.connection
+        return (
+            not connection.closed
+            and connection.info.transaction_status != TRANSACTION_STATUS_UNKNOWN
+        )
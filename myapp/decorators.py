@@ -0,0 +1,57 @@
+from functools import wraps
+from django.conf import settings
+from django.contrib import messages
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+from myapp.catalog import get_catalog_state
+
+
+def catalog_condition(private=False):
+    """
+    Answer conditional GETs with 304 while the catalog is unchanged.
+
+    Validators come from ``get_catalog_state`` so a matching request never
+    builds the view's context. With ``private=True`` (admin pages) only an
+    ETag scoped to the logged-in user is sent, and revalidation is skipped
+    whenever the page would carry flash messages or set the CSRF cookie.
+    """
+
+    def can_revalidate(request):
+        if not private:
+            return True
+        if settings.CSRF_COOKIE_NAME not in request.COOKIES:
+            return False
+        return len(messages.get_messages(request)) == 0
+
+    def etag(request, *args, **kwargs):
+        if not can_revalidate(request):
+            return None
+        value = get_catalog_state()["etag"]
+        if private:
+            value = f"{request.session.get('user_id')}-{value}"
+        return value
+
+    def last_modified(request, *args, **kwargs):
+        if private:
+            return None
+        return get_catalog_state()["last_modified"]
+
+    def decorator(view_func):
+        conditional_view = condition(etag_func=etag, last_modified_func=last_modified)(
+            view_func
+        )
+
+        @wraps(view_func)
+        def inner(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if request.method in ("GET", "HEAD"):
+                # Make clients revalidate instead of guessing a freshness lifetime
+                if private:
+                    patch_cache_control(response, private=True, no_cache=True)
+                else:
+                    patch_cache_control(response, public=True, max_age=0)
+            return response
+
+        return inner
+
+    return decorator
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with its cost taken from ``PASSWORD_PBKDF2_ITERATIONS``.
+
+    It keeps the stock ``pbkdf2_sha256`` algorithm name, so existing hashes
+    verify unchanged. Hashes at any other cost, higher or lower, are
+    re-encoded on the next successful login (see ``must_update``).
+    """
+
+    @property
+    def iterations(self):
+        return (
+            getattr(settings, "PASSWORD_PBKDF2_ITERATIONS", None)
+            or PBKDF2PasswordHasher.iterations
+        )
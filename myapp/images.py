@@ -0,0 +1,141 @@
+import logging
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+
+logger = logging.getLogger(__name__)
+
+# Product cards are at most ~380px wide, so these cover 1x and 2x screens
+INVERTER_IMAGE_WIDTHS = [320, 480, 760]
+# Slides span the viewport; the top size matches the recommended upload
+SLIDER_IMAGE_WIDTHS = [640, 960, 1280, 1920]
+
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+
+def _flatten(image):
+    from PIL import Image
+
+    # JPEG has no alpha channel, so composite transparent uploads onto white
+    if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def generate_derivatives(field_file, widths):
+    """
+    Store resized WebP and JPEG copies of an uploaded image next to it.
+
+    Returns a list of ``{"width", "format", "name"}`` dicts for the model's
+    ``image_variants`` field. Widths larger than the original are clamped to
+    the original width, so small uploads are re-encoded but never upscaled.
+    """
+    # Pillow is only needed when an image is uploaded, not on page views
+    from PIL import Image, ImageOps
+
+    storage = field_file.storage
+    field_file.open("rb")
+    try:
+        with Image.open(field_file) as source:
+            source = ImageOps.exif_transpose(source)
+            source.load()
+    finally:
+        field_file.close()
+
+    stem, _ = os.path.splitext(field_file.name)
+    targets = sorted({min(width, source.width) for width in widths})
+
+    variants = []
+    try:
+        for width in targets:
+            height = max(1, round(source.height * width / source.width))
+            resized = source.resize((width, height), Image.LANCZOS)
+            for fmt, (pil_format, options) in DERIVATIVE_FORMATS.items():
+                image = resized if fmt == "webp" else _flatten(resized)
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+                buffer = BytesIO()
+                image.save(buffer, pil_format, **options)
+                name = storage.save(
+                    f"{stem}-{width}w.{fmt}", ContentFile(buffer.getvalue())
+                )
+                variants.append({"width": width, "format": fmt, "name": name})
+    except Exception:
+        # Don't leave a partial set behind
+        delete_derivatives(storage, variants)
+        raise
+    return variants
+
+
+def delete_derivatives(storage, variants):
+    for variant in variants or []:
+        try:
+            storage.delete(variant["name"])
+        except Exception as e:
+            logger.warning(f"Image derivative couldn't be deleted: {str(e)}")
+
+
+def replace_image(instance, upload, widths):
+    """
+    Store ``upload`` as ``instance.image`` and rebuild its derivatives.
+
+    The caller saves the instance and then removes the previous image and
+    derivatives, so a failed save never leaves the row pointing at deleted
+    files. If resizing fails the upload is kept and pages fall back to the
+    original.
+    """
+    instance.image.save(upload.name, upload, save=False)
+    try:
+        instance.image_variants = generate_derivatives(instance.image, widths)
+    except Exception as e:
+        logger.warning(f"Image derivatives couldn't be generated: {str(e)}")
+        instance.image_variants = []
+
+
+def resolve_image_urls(instance):
+    """
+    Store the delivery and thumbnail URLs of ``instance.image`` on the row.
+
+    Each derivative gets its ``url`` too, so pages build ``srcset`` strings
+    from stored values and never ask the storage backend for a URL. The
+    delivery URL is the widest JPEG derivative, the thumbnail the narrowest;
+    without derivatives both are the original.
+    """
+    if not instance.image:
+        instance.image_url = instance.thumbnail_url = ""
+        return
+    storage = instance.image.storage
+    for variant in instance.image_variants or []:
+        if "url" not in variant:
+            variant["url"] = storage.url(variant["name"])
+    jpegs = sorted(
+        (v for v in instance.image_variants or [] if v["format"] == "jpeg"),
+        key=lambda v: v["width"],
+    )
+    if jpegs:
+        instance.image_url = jpegs[-1]["url"]
+        instance.thumbnail_url = jpegs[0]["url"]
+    else:
+        instance.image_url = instance.thumbnail_url = instance.image.url
+
+
+def image_sources(image_url, variants):
+    """
+    Build the ``srcset`` strings and fallback URL from stored URLs.
+
+    Without derivatives both srcsets are empty and ``src`` is ``image_url``.
+    """
+    srcsets = {}
+    for fmt in DERIVATIVE_FORMATS:
+        entries = sorted(
+            (v for v in variants or [] if v["format"] == fmt), key=lambda v: v["width"]
+        )
+        srcsets[fmt] = ", ".join(f"{v['url']} {v['width']}w" for v in entries)
+    return {"webp": srcsets["webp"], "jpeg": srcsets["jpeg"], "src": image_url}
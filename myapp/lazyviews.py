@@ -0,0 +1,43 @@
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+
+# View attributes Django reads from the URL callback before calling it.
+# Only these are forwarded: others, like ``view_class``, are probed for
+# every route when the URLconf is first reversed, which would import them all
+FORWARDED_ATTRIBUTES = {"csrf_exempt"}
+
+
+class LazyView:
+    """
+    URLconf placeholder that imports a view on its first request.
+
+    Lets urls.py name every route without importing the admin and API
+    modules (and DRF, Pillow, the storage client...) on a cold start that
+    only serves the storefront. Class-based views get ``as_view(**initkwargs)``.
+    """
+
+    def __init__(self, dotted_path, **initkwargs):
+        self.dotted_path = dotted_path
+        self.initkwargs = initkwargs
+        self.__module__, self.__name__ = dotted_path.rsplit(".", 1)
+        self.__qualname__ = self.__name__
+
+    @cached_property
+    def view(self):
+        target = import_string(self.dotted_path)
+        if hasattr(target, "as_view"):
+            return target.as_view(**self.initkwargs)
+        return target
+
+    def __call__(self, request, *args, **kwargs):
+        return self.view(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # Only called for attributes missing on the placeholder itself
+        if name in FORWARDED_ATTRIBUTES:
+            return getattr(self.view, name)
+        raise AttributeError(name)
+
+
+def lazy_view(dotted_path, **initkwargs):
+    return LazyView(dotted_path, **initkwargs)
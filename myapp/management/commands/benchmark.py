@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from myapp.benchmarks import SCENARIOS, compare, run
+
+DEFAULT_DIR = Path(settings.BASE_DIR) / "benchmarks"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure p50/p95/p99 latency and throughput of the storefront, admin "
+        "and login flows under concurrency, and compare against a baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--route",
+            action="append",
+            choices=list(SCENARIOS),
+            help="Route to measure; repeat for several (default: all).",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=50,
+            help="Timed requests per worker and route (default: 50).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Concurrent workers, each with its own client (default: 4).",
+        )
+        parser.add_argument(
+            "--output",
+            default=str(DEFAULT_DIR / "latest.json"),
+            help="Where to write the results (default: benchmarks/latest.json).",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=str(DEFAULT_DIR / "baseline.json"),
+            help="Baseline to compare against (default: benchmarks/baseline.json).",
+        )
+        parser.add_argument(
+            "--budget",
+            type=float,
+            default=20.0,
+            help="Allowed p95 regression over the baseline, in percent (default: 20).",
+        )
+        parser.add_argument(
+            "--slack-ms",
+            type=float,
+            default=2.0,
+            help="p95 rises smaller than this never count as regressions (default: 2).",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Store these results as the new baseline instead of comparing.",
+        )
+        parser.add_argument("--host", default="localhost")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests and --concurrency must be at least 1.")
+
+        routes = options["route"] or list(SCENARIOS)
+        results = run(routes, options["requests"], options["concurrency"], options["host"])
+        results["recorded_at"] = timezone.now().isoformat()
+
+        self.stdout.write(
+            f"{options['concurrency']} workers x {options['requests']} requests per route"
+        )
+        self.stdout.write(
+            f"{'route':<18}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+        )
+        for name, route in results["routes"].items():
+            self.stdout.write(
+                f"{name:<18}{route['throughput_rps']:>9.1f}{route['p50_ms']:>10.2f}"
+                f"{route['p95_ms']:>10.2f}{route['p99_ms']:>10.2f}{route['errors']:>8}"
+            )
+
+        output = Path(options["baseline"] if options["save_baseline"] else options["output"])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2) + "\n")
+        self.stdout.write(f"Results written to {output}")
+        if options["save_baseline"]:
+            return
+
+        baseline_path = Path(options["baseline"])
+        if not baseline_path.exists():
+            self.stdout.write(
+                self.style.WARNING(
+                    f"No baseline at {baseline_path}; record one with --save-baseline."
+                )
+            )
+            baseline = {}
+        else:
+            baseline = json.loads(baseline_path.read_text())
+
+        regressions = compare(
+            results, baseline, options["budget"] / 100, options["slack_ms"]
+        )
+        if regressions:
+            raise CommandError("Benchmark regressions:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS("All routes within budget."))
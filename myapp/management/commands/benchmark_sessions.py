@@ -0,0 +1,98 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+ADMIN_PATHS = ["/dashboard/", "/products/", "/slider/"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request session overhead of each session backend "
+        "against the admin views."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=20,
+            help="Timed requests per admin view and backend (default: 20).",
+        )
+        parser.add_argument(
+            "--mode",
+            action="append",
+            choices=sorted(settings.SESSION_ENGINES),
+            help="Backend to measure; repeat for several (default: all).",
+        )
+        parser.add_argument("--host", default="localhost")
+
+    def login(self, client):
+        session = client.session
+        session["user_id"] = 0
+        session["username"] = "benchmark"
+        session["email"] = "benchmark@example.com"
+        session["login_time"] = int(time.time())
+        session["is_authenticated"] = True
+        session.save()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        return session
+
+    def measure(self, engine, requests, host):
+        timings = []
+        session_queries = 0
+        with override_settings(SESSION_ENGINE=engine):
+            client = Client(HTTP_HOST=host)
+            session = self.login(client)
+            # Warm up templates, the catalog cache and (for cached_db) the session
+            for path in ADMIN_PATHS:
+                client.get(path)
+
+            for path in ADMIN_PATHS:
+                for _ in range(requests):
+                    with CaptureQueriesContext(connection) as queries:
+                        started = time.perf_counter()
+                        response = client.get(path)
+                        timings.append(time.perf_counter() - started)
+                    if response.status_code != 200:
+                        raise CommandError(
+                            f"{path} returned {response.status_code} with {engine}"
+                        )
+                    session_queries += sum(
+                        "django_session" in query["sql"]
+                        for query in queries.captured_queries
+                    )
+            session.delete()
+        return timings, session_queries / len(timings)
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1.")
+
+        modes = options["mode"] or list(settings.SESSION_ENGINES)
+        self.stdout.write(
+            f"{len(ADMIN_PATHS) * options['requests']} requests per backend over "
+            f"{', '.join(ADMIN_PATHS)}; cache backend: "
+            f"{settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1]}"
+        )
+        self.stdout.write(
+            f"{'backend':<16}{'session queries/req':>20}{'median ms':>12}{'p95 ms':>10}"
+        )
+        for mode in modes:
+            timings, queries = self.measure(
+                settings.SESSION_ENGINES[mode], options["requests"], options["host"]
+            )
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(
+                f"{mode:<16}{queries:>20.2f}"
+                f"{statistics.median(timings) * 1000:>12.2f}{p95 * 1000:>10.2f}"
+            )
+        self.stdout.write(
+            "Each session query is a round trip to the database; on a remote "
+            "database that dominates the difference between backends."
+        )
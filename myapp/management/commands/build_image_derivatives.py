@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from myapp.images import (
+    INVERTER_IMAGE_WIDTHS,
+    SLIDER_IMAGE_WIDTHS,
+    delete_derivatives,
+    generate_derivatives,
+)
+from myapp.models import Inverter, HomepageSlider
+
+
+class Command(BaseCommand):
+    help = "Generate responsive WebP/JPEG derivatives for stored catalog images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild images that already have derivatives.",
+        )
+
+    def handle(self, *args, **options):
+        for model, widths in (
+            (Inverter, INVERTER_IMAGE_WIDTHS),
+            (HomepageSlider, SLIDER_IMAGE_WIDTHS),
+        ):
+            queryset = model.objects.exclude(image="").exclude(image__isnull=True)
+            if not options["force"]:
+                queryset = queryset.filter(image_variants=[])
+
+            built = failed = 0
+            for obj in queryset.only("id", "image", "image_variants").iterator():
+                try:
+                    variants = generate_derivatives(obj.image, widths)
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{model.__name__} {obj.pk}: {e}")
+                    continue
+                delete_derivatives(obj.image.storage, obj.image_variants)
+                obj.image_variants = variants
+                # save() keeps updated_at, signals and the catalog cache in step
+                obj.save(update_fields=["image_variants", "updated_at"])
+                built += 1
+
+            self.stdout.write(
+                f"{model.__name__}: {built} images processed, {failed} failed."
+            )
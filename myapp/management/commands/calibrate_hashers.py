@@ -0,0 +1,77 @@
+import statistics
+import time
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, get_hashers
+from django.core.management.base import BaseCommand, CommandError
+
+SAMPLE_PASSWORD = "calibration-password"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the configured password hashers on this machine and "
+        "recommend an iteration count for a target hashing latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=250.0,
+            help="Desired time for one hash, in milliseconds (default: 250).",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=5,
+            help="Timed runs per hasher; the median is used (default: 5).",
+        )
+
+    def time_encode(self, hasher, samples, **kwargs):
+        salt = hasher.salt()
+        timings = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            hasher.encode(SAMPLE_PASSWORD, salt, **kwargs)
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+
+    def handle(self, *args, **options):
+        target = options["target_ms"] / 1000
+        samples = options["samples"]
+        if target <= 0 or samples < 1:
+            raise CommandError("--target-ms and --samples must be positive.")
+
+        for index, hasher in enumerate(get_hashers()):
+            label = f"{hasher.algorithm}{' (default)' if index == 0 else ''}"
+            current = getattr(hasher, "iterations", None)
+
+            if not current:
+                # scrypt/bcrypt/argon2 have multi-parameter costs; report only
+                elapsed = self.time_encode(hasher, samples)
+                self.stdout.write(f"{label}: {elapsed * 1000:.0f} ms per hash")
+                continue
+
+            # Time a fixed, cheaper run and scale; PBKDF2 cost is linear
+            probe = max(1000, current // 10)
+            per_iteration = self.time_encode(hasher, samples, iterations=probe) / probe
+            recommended = int(target / per_iteration) // 1000 * 1000
+            self.stdout.write(
+                f"{label}: {current:,} iterations take "
+                f"{current * per_iteration * 1000:.0f} ms; "
+                f"{recommended:,} iterations take about {options['target_ms']:.0f} ms"
+            )
+            if index == 0:
+                self.stdout.write(
+                    self.style.SUCCESS(f"PASSWORD_PBKDF2_ITERATIONS={recommended}")
+                )
+                if (
+                    isinstance(hasher, PBKDF2PasswordHasher)
+                    and recommended < PBKDF2PasswordHasher.iterations
+                ):
+                    self.stdout.write(
+                        self.style.WARNING(
+                            "This is below Django's default work factor; "
+                            "prefer a higher latency budget if logins allow it."
+                        )
+                    )
@@ -0,0 +1,193 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, get_hasher
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Value
+from django.db.models.functions import Concat
+from myapp.catalog import bump_catalog_version
+from myapp.models import HomepageSlider, Inverter, User, product_icon
+from myapp.signals import inverter_delete_receivers_disconnected
+from myapp.stats import refresh_brand_summaries
+from myapp.synthetic import (
+    BRANDS,
+    MODEL_PREFIX,
+    PASSWORD_TEMPLATE,
+    SLIDE_TITLE_PREFIX,
+    USERNAME_PREFIX,
+    inverter_batch,
+    placeholder_images,
+    slider_rows,
+    user_batch,
+)
+
+
+def bounded_map(pool, fn, jobs, window):
+    """
+    Like ``pool.map`` but with at most ``window`` batches in flight, so a
+    slow database can't leave a million generated rows waiting in memory.
+    """
+    pending = deque()
+    for args in jobs:
+        pending.append(pool.submit(fn, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the database with reproducible synthetic inverters, slides and "
+        "users for scale testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--inverters", type=int, default=10000)
+        parser.add_argument("--sliders", type=int, default=10)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processes generating rows and hashing passwords (default: CPU count).",
+        )
+        parser.add_argument(
+            "--hash-iterations",
+            type=int,
+            help=(
+                "PBKDF2 iterations for user passwords (default: the configured "
+                "cost). Lower costs build faster and are upgraded on login."
+            ),
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete previously generated rows first.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size and --workers must be at least 1.")
+        if min(options["inverters"], options["sliders"], options["users"]) < 0:
+            raise CommandError("Row counts can't be negative.")
+        if options["hash_iterations"] and not isinstance(
+            get_hasher("default"), PBKDF2PasswordHasher
+        ):
+            raise CommandError("--hash-iterations needs a PBKDF2 default hasher.")
+
+        if options["clear"]:
+            self.clear()
+
+        # Forked workers must not share the parent's database sockets
+        connections.close_all()
+        with ProcessPoolExecutor(options["workers"]) as pool:
+            if options["inverters"]:
+                self.generate_inverters(pool, options)
+            if options["users"]:
+                self.generate_users(pool, options)
+        if options["sliders"]:
+            self.generate_sliders(options)
+
+    def batches(self, total, batch_size):
+        for batch, start in enumerate(range(0, total, batch_size)):
+            yield batch, start, min(batch_size, total - start)
+
+    def report(self, label, written, started):
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f"{label}: {written:,} rows in {elapsed:.1f}s "
+            f"({written / max(elapsed, 1e-9):,.0f} rows/s)"
+        )
+
+    def clear(self):
+        with transaction.atomic():
+            # One DELETE instead of a post_delete signal per inverter; the
+            # summaries and catalog version they maintain are refreshed below
+            with inverter_delete_receivers_disconnected():
+                inverters, _ = Inverter.objects.filter(
+                    model__startswith=MODEL_PREFIX
+                ).delete()
+            # Only the exact generated accounts, not real users that happen
+            # to share the prefix
+            users, _ = User.objects.filter(
+                username__regex=rf"^{USERNAME_PREFIX}\d+$",
+                email=Concat("username", Value("@example.com")),
+            ).delete()
+            sliders, _ = HomepageSlider.objects.filter(
+                title__startswith=SLIDE_TITLE_PREFIX
+            ).delete()
+            refresh_brand_summaries()
+            transaction.on_commit(bump_catalog_version)
+        self.stdout.write(
+            f"Cleared {inverters:,} inverters, {users:,} users and {sliders:,} slides."
+        )
+
+    def generate_inverters(self, pool, options):
+        started = time.monotonic()
+        jobs = (
+            (options["seed"], batch, start, count)
+            for batch, start, count in self.batches(
+                options["inverters"], options["batch_size"]
+            )
+        )
+        written = 0
+        for rows in bounded_map(pool, inverter_batch, jobs, 2 * options["workers"]):
+            Inverter.objects.bulk_create(
+                [Inverter(icon=product_icon(row["name"]), **row) for row in rows],
+                ignore_conflicts=True,
+            )
+            written += len(rows)
+            self.stdout.write(f"  inverters {written:,}/{options['inverters']:,}")
+
+        # bulk_create skips the signals, so catch up here; the search vectors
+        # are filled in by the database trigger
+        refresh_brand_summaries(brand for brand, _, _ in BRANDS)
+        bump_catalog_version()
+        self.report("Inverters", written, started)
+
+    def generate_users(self, pool, options):
+        started = time.monotonic()
+        jobs = (
+            (options["seed"], batch, start, count, options["hash_iterations"])
+            for batch, start, count in self.batches(
+                options["users"], options["batch_size"]
+            )
+        )
+        written = 0
+        for rows in bounded_map(pool, user_batch, jobs, 2 * options["workers"]):
+            User.objects.bulk_create(
+                [
+                    User(username=username, email=email, password=password)
+                    for username, email, password in rows
+                ],
+                ignore_conflicts=True,
+            )
+            written += len(rows)
+            self.stdout.write(f"  users {written:,}/{options['users']:,}")
+        self.report("Users", written, started)
+        self.stdout.write(
+            f"User {USERNAME_PREFIX}<i> logs in with "
+            f"{PASSWORD_TEMPLATE.format(index='<i>')}"
+        )
+
+    def generate_sliders(self, options):
+        started = time.monotonic()
+        existing = HomepageSlider.objects.filter(
+            title__startswith=SLIDE_TITLE_PREFIX
+        ).count()
+        rows = slider_rows(
+            options["seed"],
+            options["sliders"],
+            placeholder_images(min(options["sliders"], 5)),
+            start=existing,
+        )
+        # Slides have no natural key, so only the missing ones are added
+        HomepageSlider.objects.bulk_create([HomepageSlider(**row) for row in rows])
+        bump_catalog_version()
+        self.report("Slides", len(rows), started)
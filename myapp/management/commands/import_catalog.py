@@ -0,0 +1,71 @@
+import csv
+import io
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from myapp.catalog_import import CatalogImporter, detect_format
+
+
+class Command(BaseCommand):
+    help = "Stream a CSV or JSONL supplier file into the inverter catalog."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Input format (default: guessed from the file extension).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without writing anything.",
+        )
+        parser.add_argument(
+            "--errors-file",
+            help="Write the per-row error report to this CSV file.",
+        )
+        parser.add_argument(
+            "--max-errors",
+            type=int,
+            default=1000,
+            help="Row errors kept in memory for the report.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        path = options["path"]
+        fmt = options["format"] or detect_format(path)
+        importer = CatalogImporter(
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+            max_errors=options["max_errors"],
+        )
+
+        try:
+            if path == "-":
+                stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig")
+                report = importer.run(stream, fmt)
+            else:
+                with open(path, newline="", encoding="utf-8-sig") as stream:
+                    report = importer.run(stream, fmt)
+        except OSError as e:
+            raise CommandError(f"Unable to read {path}: {e}")
+
+        if options["errors_file"]:
+            with open(options["errors_file"], "w", newline="") as out:
+                writer = csv.writer(out)
+                writer.writerow(["line", "errors"])
+                for line_number, messages in report.errors:
+                    writer.writerow([line_number, " ".join(messages)])
+        else:
+            for line_number, messages in report.errors[:20]:
+                self.stderr.write(f"Line {line_number}: {' '.join(messages)}")
+            if report.error_count > 20:
+                self.stderr.write(f"... {report.error_count - 20} more errors")
+
+        prefix = "Dry run: " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(prefix + report.summary()))
@@ -0,0 +1,58 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from myapp.uploads import due_jobs, process_job, retry_failed_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Upload the admin images queued by the products and slider pages. Run "
+        "it as a worker with --watch, or from cron every minute or so."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Also requeue uploads that ran out of attempts.",
+        )
+        parser.add_argument(
+            "--watch",
+            type=float,
+            metavar="SECONDS",
+            help="Keep running, polling for new jobs at this interval.",
+        )
+
+    def handle(self, *args, **options):
+        if options["retry_failed"]:
+            self.stdout.write(f"{retry_failed_jobs()} failed uploads requeued.")
+
+        while True:
+            uploaded, failed = self.process_due_jobs()
+            if uploaded or failed or not options["watch"]:
+                self.stdout.write(
+                    f"{uploaded} images uploaded, {failed} not uploaded."
+                )
+            if not options["watch"]:
+                return
+            close_old_connections()
+            time.sleep(options["watch"])
+
+    def process_due_jobs(self):
+        uploaded = failed = 0
+        for job_id in due_jobs().values_list("pk", flat=True):
+            try:
+                done = process_job(job_id)
+            except Exception as e:
+                # The job stays queued and is retried once its lease runs out
+                logger.error(f"Image upload job {job_id} crashed: {str(e)}")
+                done = False
+            if done:
+                uploaded += 1
+            else:
+                failed += 1
+        return uploaded, failed
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from myapp.startup import HEAVY_MODULES, measure_cold_start
+
+
+class Command(BaseCommand):
+    help = (
+        "Start the serverless entry point in a fresh interpreter, serve one "
+        "request and report import time per module."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/", help="Request path (default: /).")
+        parser.add_argument(
+            "--top", type=int, default=25, help="Modules to list (default: 25)."
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["self", "cumulative"],
+            default="self",
+            help="Rank modules by their own or cumulative import time.",
+        )
+
+    def handle(self, *args, **options):
+        result = measure_cold_start(options["path"], importtime=True)
+
+        self.stdout.write(
+            f"{options['path']} -> {result['status']}: import {result['import_ms']:.0f} ms, "
+            f"first response {result['first_response_ms']:.0f} ms, "
+            f"total {result['total_ms']:.0f} ms, {len(result['modules'])} modules"
+        )
+
+        column = 0 if options["sort"] == "self" else 1
+        rows = sorted(result["imports"], key=lambda row: row[column], reverse=True)
+        self.stdout.write(f"{'self ms':>9}{'cumul ms':>10}  module")
+        for self_us, cumulative_us, name in rows[: options["top"]]:
+            self.stdout.write(f"{self_us / 1000:>9.1f}{cumulative_us / 1000:>10.1f}  {name}")
+
+        loaded = [name for name in HEAVY_MODULES if name in result["modules"]]
+        if loaded:
+            self.stdout.write(
+                self.style.WARNING(f"Heavy modules loaded: {', '.join(loaded)}")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("No heavy modules loaded."))
@@ -1,40 +1,35 @@
+from django.conf import settings
 from django.shortcuts import redirect
 from django.contrib import messages
+from django.utils.module_loading import import_string
+
 
 class AuthMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        # Protected prefixes are declared in settings.PROTECTED_ROUTES and
+        # matched with one str.startswith call per request
+        self.protected_prefixes = tuple(import_string(settings.PROTECTED_ROUTES))
 
     def __call__(self, request):
-        # Define paths that explicitly require authentication
-        protected_paths = [
-            "/dashboard/",
-            "/dashboard",
-            "/products/",
-            "/slider/",
-            # "/registeruser/",
-        ]
-        
-        # Get current path
-        path = request.path
-        
-        # Check if path is protected
-        is_protected = any(path.startswith(p) for p in protected_paths)
-        
+        # Public and static requests skip the session entirely
+        if not request.path.startswith(self.protected_prefixes):
+            return self.get_response(request)
+
         # Check if user is authenticated
         is_authenticated = request.session.get("is_authenticated", False)
-        
+
         # If accessing protected path and not authenticated, redirect
-        if is_protected and not is_authenticated:
+        if not is_authenticated:
             # Store the attempted URL for redirect after login
             request.session['next'] = request.get_full_path()
-            
+
             # Add warning message
             messages.warning(request, "You need to login first to access this page.")
-            
+
             # Return redirect response immediately
             return redirect("login")
-        
+
         # Continue with normal request processing
         response = self.get_response(request)
         return response
@@ -0,0 +1,46 @@
+import logging
+
+from django.db import connection
+from myapp.profiling import add_server_timing, profiled_request
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseTimingMiddleware:
+    """
+    Record database connect time versus query time for every request.
+
+    Enabled by the DB_TIMING setting. Both figures go out in a
+    ``Server-Timing`` header, so the browser's network panel shows them next
+    to the response. A warning is logged when opening the connection cost
+    more than all of the request's queries.
+    """
+
+    slow_connect_ms = 20
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        connect_time = getattr(connection, "connect_time", 0.0)
+        connect_count = getattr(connection, "connect_count", 0)
+
+        with profiled_request() as (profile, _):
+            response = self.get_response(request)
+
+        connect_ms = (getattr(connection, "connect_time", 0.0) - connect_time) * 1000
+        connects = getattr(connection, "connect_count", 0) - connect_count
+        query_ms = profile.sql_time * 1000
+
+        add_server_timing(
+            response,
+            f'db-connect;dur={connect_ms:.1f};desc="{connects} connects", '
+            f'db-query;dur={query_ms:.1f};desc="{profile.query_count} queries"',
+        )
+
+        if connect_ms > self.slow_connect_ms and connect_ms > query_ms:
+            logger.warning(
+                f"Database connect took {connect_ms:.1f} ms vs {query_ms:.1f} ms "
+                f"of queries for {request.path}"
+            )
+        return response
@@ -0,0 +1,137 @@
+import logging
+import threading
+import time
+from io import BytesIO
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from myapp.catalog import get_catalog_version
+
+logger = logging.getLogger(__name__)
+
+
+class AnonymousPageCacheMiddleware:
+    """
+    Full-page cache for anonymous GETs with stale-while-revalidate.
+
+    Sits above the session, auth and message middleware so a hit skips them
+    entirely. Entries are keyed by the release, the catalog version, the path
+    and only the query parameters in PAGE_CACHE_QUERY_PARAMS, so deploys and
+    catalog edits take effect at once and junk query strings can't fill or
+    bypass the cache. Once an
+    entry is older than PAGE_CACHE_SOFT_TTL, the next request (conditional
+    or not) still gets the stale copy immediately while a background thread
+    renders a fresh one. If a serverless instance is frozen mid-rebuild, the
+    lock expires after the soft TTL and a later request starts another.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.paths = set(getattr(settings, "PAGE_CACHE_PATHS", ["/"]))
+        self.soft_ttl = getattr(settings, "PAGE_CACHE_SOFT_TTL", 60)
+        self.hard_ttl = getattr(settings, "PAGE_CACHE_HARD_TTL", 3600)
+        self.query_params = sorted(getattr(settings, "PAGE_CACHE_QUERY_PARAMS", []))
+
+    def __call__(self, request):
+        if not self.is_cacheable_request(request):
+            return self.get_response(request)
+
+        key = self.cache_key(request)
+        entry = cache.get(key)
+
+        if entry is None:
+            response = self.get_response(request)
+            self.store(key, response)
+            return response
+
+        if time.time() > entry["fresh_until"]:
+            self.revalidate_in_background(key, request)
+
+        response = entry["response"]
+        return get_conditional_response(
+            request,
+            etag=response.get("ETag"),
+            last_modified=entry["last_modified"],
+            response=response,
+        )
+
+    def is_cacheable_request(self, request):
+        if request.method not in ("GET", "HEAD"):
+            return False
+        if request.path not in self.paths:
+            return False
+        # A session cookie means a logged-in user or pending flash messages
+        return settings.SESSION_COOKIE_NAME not in request.COOKIES
+
+    def is_cacheable_response(self, response):
+        if response.status_code != 200 or response.streaming:
+            return False
+        # Never replay cookies (session, CSRF, flash messages) to other visitors
+        if response.cookies:
+            return False
+        cache_control = response.get("Cache-Control", "")
+        return "private" not in cache_control and "no-store" not in cache_control
+
+    def cache_key(self, request):
+        params = [
+            (name, value)
+            for name in self.query_params
+            for value in request.GET.getlist(name)
+        ]
+        query = f"?{urlencode(params)}" if params else ""
+        version = get_catalog_version()
+        return f"page:{settings.RELEASE}:{version}:{request.path}{query}"
+
+    def store(self, key, response):
+        if not self.is_cacheable_response(response):
+            return
+        if hasattr(response, "render") and callable(response.render):
+            response.render()
+        # Timings describe this render, not the hits replaying it later
+        timing = response.get("Server-Timing")
+        if timing is not None:
+            del response["Server-Timing"]
+        entry = {
+            "response": response,
+            "last_modified": parse_http_date_safe(response.get("Last-Modified", "")),
+            "fresh_until": time.time() + self.soft_ttl,
+        }
+        # The cache serializes the entry here, so the header can go back on
+        cache.set(key, entry, self.hard_ttl)
+        if timing is not None:
+            response["Server-Timing"] = timing
+
+    def revalidate_in_background(self, key, request):
+        # Only one rebuild per entry at a time, across threads and processes
+        if not cache.add(f"{key}:rebuilding", True, self.soft_ttl):
+            return
+
+        # A plain GET, so a conditional hit still gets a full page to store
+        environ = dict(request.META)
+        environ["wsgi.input"] = BytesIO()
+        environ["REQUEST_METHOD"] = "GET"
+        environ.pop("HTTP_IF_NONE_MATCH", None)
+        environ.pop("HTTP_IF_MODIFIED_SINCE", None)
+
+        thread = threading.Thread(
+            target=self.rebuild,
+            args=(key, environ),
+            name=f"page-cache-rebuild {key}",
+            daemon=True,
+        )
+        thread.start()
+
+    def rebuild(self, key, environ):
+        try:
+            response = self.get_response(WSGIRequest(environ))
+            self.store(key, response)
+        except Exception as e:
+            logger.error(f"Background page rebuild failed for {key}: {str(e)}")
+        finally:
+            cache.delete(f"{key}:rebuilding")
+            connections.close_all()
@@ -0,0 +1,74 @@
+import json
+import logging
+import time
+from collections import Counter
+
+from django.conf import settings
+from myapp.profiling import add_server_timing, profiled_request
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfileMiddleware:
+    """
+    Opt-in view profiling: query count, SQL time, template time and view time.
+
+    The figures go out as ``Server-Timing`` entries and as one JSON log line
+    per request. Any SQL shape run more than REQUEST_PROFILE_REPEAT_THRESHOLD
+    times in the view is logged as a likely N+1.
+
+    Sits last in MIDDLEWARE, so the timings cover the view rather than the
+    session and auth middleware around it. Queries are timed by the shared
+    profile from DatabaseTimingMiddleware, which settings enable alongside;
+    its ``db-query`` entry then stands for the SQL, so no ``sql`` entry is
+    added for the same queries.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.repeat_threshold = getattr(settings, "REQUEST_PROFILE_REPEAT_THRESHOLD", 5)
+
+    def __call__(self, request):
+        with profiled_request() as (profile, created):
+            started = time.perf_counter()
+            sql_time = profile.sql_time
+            template_time = profile.template_time
+            shapes = Counter(profile.shapes)
+
+            response = self.get_response(request)
+            # Template responses render on the way out; include them
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+
+        view_ms = (time.perf_counter() - started) * 1000
+        sql_ms = (profile.sql_time - sql_time) * 1000
+        template_ms = (profile.template_time - template_time) * 1000
+        queries = profile.query_count - sum(shapes.values())
+        repeated = profile.repeated_shapes(self.repeat_threshold, since=shapes)
+
+        timing = f"tpl;dur={template_ms:.1f}, view;dur={view_ms:.1f}"
+        if created:
+            timing = f'sql;dur={sql_ms:.1f};desc="{queries} queries", {timing}'
+        if repeated:
+            timing += f', n1;desc="{len(repeated)} repeated shapes"'
+        add_server_timing(response, timing)
+
+        logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "queries": queries,
+                    "sql_ms": round(sql_ms, 2),
+                    "template_ms": round(template_ms, 2),
+                    "view_ms": round(view_ms, 2),
+                    "repeated_shapes": len(repeated),
+                }
+            )
+        )
+        for shape, count in repeated:
+            logger.warning(
+                f"Likely N+1 on {request.path}: ran {count} times: {shape[:300]}"
+            )
+        return response
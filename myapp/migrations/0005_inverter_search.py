@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:46
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def populate_search_vector(apps, schema_editor):
+    Inverter = apps.get_model("myapp", "Inverter")
+    Inverter.objects.update(
+        search_vector=SearchVector("name", weight="A", config="english")
+        + SearchVector("model", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0004_remove_homepageslider_mobile_image"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="inverter",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="inverter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="inverter_search_vector_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inverter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="inverter_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inverter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["model"], name="inverter_model_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
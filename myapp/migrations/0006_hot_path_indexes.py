@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("myapp", "0005_inverter_search"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inverter",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="inverter_created_id_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inverter",
+            index=models.Index(fields=["brand"], name="inverter_brand_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="inverter",
+            index=models.Index(fields=["power_capacity_kw"], name="inverter_power_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="inverter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="inverter_name_upper_trgm",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inverter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("brand"), name="gin_trgm_ops"
+                ),
+                name="inverter_brand_upper_trgm",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inverter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("model"), name="gin_trgm_ops"
+                ),
+                name="inverter_model_upper_trgm",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="homepageslider",
+            index=models.Index(fields=["-created_at"], name="slider_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="homepageslider",
+            index=models.Index(fields=["-updated_at"], name="slider_updated_idx"),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:53
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+
+
+def populate_brand_summaries(apps, schema_editor):
+    Inverter = apps.get_model("myapp", "Inverter")
+    BrandSummary = apps.get_model("myapp", "BrandSummary")
+    rows = Inverter.objects.values("brand").annotate(
+        inverter_count=Count("id"),
+        price_sum=Sum("price"),
+        price_min=Min("price"),
+        price_max=Max("price"),
+        power_sum=Sum("power_capacity_kw"),
+        power_min=Min("power_capacity_kw"),
+        power_max=Max("power_capacity_kw"),
+    )
+    BrandSummary.objects.bulk_create([BrandSummary(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0006_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BrandSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("brand", models.CharField(max_length=100, unique=True)),
+                ("inverter_count", models.PositiveIntegerField(default=0)),
+                (
+                    "price_sum",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=16),
+                ),
+                (
+                    "price_min",
+                    models.DecimalField(decimal_places=2, max_digits=10, null=True),
+                ),
+                (
+                    "price_max",
+                    models.DecimalField(decimal_places=2, max_digits=10, null=True),
+                ),
+                ("power_sum", models.FloatField(default=0)),
+                ("power_min", models.FloatField(null=True)),
+                ("power_max", models.FloatField(null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_brand_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:20
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import Count
+
+logger = logging.getLogger(__name__)
+
+
+def rename_duplicate_models(apps, schema_editor):
+    # The oldest row keeps each (brand, model); later copies get their id
+    # appended to the model so no product is lost and they can be merged
+    # by hand afterwards
+    Inverter = apps.get_model("myapp", "Inverter")
+    max_length = Inverter._meta.get_field("model").max_length
+    duplicates = (
+        Inverter.objects.values("brand", "model")
+        .annotate(rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    for pair in duplicates.iterator():
+        copies = Inverter.objects.filter(brand=pair["brand"], model=pair["model"])
+        for inverter in copies.order_by("id")[1:]:
+            suffix = f" (duplicate {inverter.id})"
+            inverter.model = pair["model"][: max_length - len(suffix)] + suffix
+            inverter.save(update_fields=["model"])
+            logger.warning(
+                "Renamed duplicate inverter %s (%s %s) to model %r",
+                inverter.id, pair["brand"], pair["model"], inverter.model,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0007_brandsummary"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_models, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="inverter",
+            constraint=models.UniqueConstraint(
+                fields=("brand", "model"), name="inverter_brand_model_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0008_inverter_brand_model_uniq"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="homepageslider",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name="inverter",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:04
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0009_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="homepageslider",
+            name="image_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("", "No upload"),
+                    ("pending", "Uploading"),
+                    ("ready", "Uploaded"),
+                    ("failed", "Upload failed"),
+                ],
+                default="",
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="inverter",
+            name="image_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("", "No upload"),
+                    ("pending", "Uploading"),
+                    ("ready", "Uploaded"),
+                    ("failed", "Upload failed"),
+                ],
+                default="",
+                max_length=10,
+            ),
+        ),
+        migrations.CreateModel(
+            name="ImageUploadJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=100)),
+                ("object_id", models.PositiveIntegerField()),
+                ("filename", models.CharField(max_length=255)),
+                ("data", models.BinaryField()),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                (
+                    "run_after",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["run_after"], name="imagejob_run_after_idx"),
+                    models.Index(
+                        fields=["model", "object_id"], name="imagejob_object_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
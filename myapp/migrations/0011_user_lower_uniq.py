@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:06
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+logger = logging.getLogger(__name__)
+
+
+def rename_case_duplicates(apps, schema_editor):
+    # Rows that differ only by case couldn't log in (the lookup matched
+    # several), so the oldest keeps its username/email and later ones get
+    # their id added; they can be merged or deleted by hand afterwards
+    User = apps.get_model("myapp", "User")
+    for field in ("username", "email"):
+        max_length = User._meta.get_field(field).max_length
+        duplicates = (
+            User.objects.values(lowered=Lower(field))
+            .annotate(rows=Count("id"))
+            .filter(rows__gt=1)
+        )
+        for group in duplicates.iterator():
+            copies = User.objects.annotate(lowered=Lower(field)).filter(
+                lowered=group["lowered"]
+            )
+            for user in copies.order_by("id")[1:]:
+                old = getattr(user, field)
+                if field == "email" and "@" in old:
+                    local, domain = old.rsplit("@", 1)
+                    suffix = f"+duplicate{user.id}@{domain}"
+                    new = local[: max_length - len(suffix)] + suffix
+                else:
+                    suffix = f"-duplicate{user.id}"
+                    new = old[: max_length - len(suffix)] + suffix
+                setattr(user, field, new)
+                user.save(update_fields=[field])
+                logger.warning(
+                    "Renamed case-duplicate %s %r of user %s to %r",
+                    field, old, user.id, new,
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0010_image_upload_jobs"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_case_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                Lower("username"), name="user_username_lower_uniq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                Lower("email"), name="user_email_lower_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:40
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+# Copied from myapp.models at the time of writing
+PRODUCT_ICONS = [("Residential", "🏠"), ("Commercial", "🏢"), ("Industrial", "🏭")]
+DEFAULT_PRODUCT_ICON = "⚡"
+
+
+def backfill_icons(apps, schema_editor):
+    Inverter = apps.get_model("myapp", "Inverter")
+    Inverter.objects.update(
+        icon=Case(
+            *[
+                When(name__contains=keyword, then=Value(icon))
+                for keyword, icon in PRODUCT_ICONS
+            ],
+            default=Value(DEFAULT_PRODUCT_ICON),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0011_user_lower_uniq"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inverter",
+            name="icon",
+            field=models.CharField(default="⚡", editable=False, max_length=4),
+        ),
+        migrations.RunPython(backfill_icons, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:30
+
+from django.db import migrations, models
+
+
+def backfill_image_urls(apps, schema_editor):
+    # Mirrors myapp.images.resolve_image_urls at the time of writing
+    for model_name in ("Inverter", "HomepageSlider"):
+        model = apps.get_model("myapp", model_name)
+        storage = model._meta.get_field("image").storage
+        rows = []
+        for row in model.objects.exclude(image="").exclude(image__isnull=True).only(
+            "id", "image", "image_variants"
+        ).iterator():
+            for variant in row.image_variants:
+                variant.setdefault("url", storage.url(variant["name"]))
+            jpegs = sorted(
+                (v for v in row.image_variants if v["format"] == "jpeg"),
+                key=lambda v: v["width"],
+            )
+            if jpegs:
+                row.image_url = jpegs[-1]["url"]
+                row.thumbnail_url = jpegs[0]["url"]
+            else:
+                row.image_url = row.thumbnail_url = storage.url(row.image.name)
+            rows.append(row)
+        model.objects.bulk_update(
+            rows, ["image_url", "thumbnail_url", "image_variants"], batch_size=500
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0012_inverter_icon"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="homepageslider",
+            name="image_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name="homepageslider",
+            name="thumbnail_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name="inverter",
+            name="image_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name="inverter",
+            name="thumbnail_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.RunPython(backfill_image_urls, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:10
+
+from django.db import migrations
+
+# Same weights as the SearchVector expressions this replaces in Inverter.save()
+SEARCH_VECTOR = """
+    setweight(to_tsvector('english'::regconfig, COALESCE({row}name, '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, COALESCE({row}model, '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, COALESCE({row}description, '')), 'B')
+"""
+
+CREATE_TRIGGER = f"""
+CREATE FUNCTION myapp_inverter_search_vector() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR.format(row="NEW.")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER inverter_search_vector_update
+    BEFORE INSERT OR UPDATE OF name, model, description ON myapp_inverter
+    FOR EACH ROW EXECUTE FUNCTION myapp_inverter_search_vector();
+
+UPDATE myapp_inverter SET search_vector = {SEARCH_VECTOR.format(row="")};
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER inverter_search_vector_update ON myapp_inverter;
+DROP FUNCTION myapp_inverter_search_vector();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("myapp", "0013_stored_image_urls"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
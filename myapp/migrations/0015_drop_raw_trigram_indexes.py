@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:03
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # The search API's trigram matches now use the UPPER() indexes from 0006,
+    # so these only cost writes. DROP INDEX CONCURRENTLY can't run in a
+    # transaction.
+    atomic = False
+
+    dependencies = [
+        ("myapp", "0014_inverter_search_vector_trigger"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="inverter",
+            name="inverter_name_trgm",
+        ),
+        RemoveIndexConcurrently(
+            model_name="inverter",
+            name="inverter_model_trgm",
+        ),
+    ]
@@ -1,10 +1,27 @@
-from django.db import models
+from django.db import models, transaction
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Lower, Upper
+from django.utils.functional import cached_property
+from myapp.images import delete_derivatives, image_sources, resolve_image_urls
 import os
 from django.utils.text import slugify
 from django.urls import reverse
 from django.utils import timezone
 
 
+class UserQuerySet(models.QuerySet):
+    # Case-insensitive matches written as LOWER(col) = %s, so the functional
+    # unique indexes serve them (iexact compiles to UPPER() and can't)
+    def filter_username(self, username):
+        return self.alias(username_lower=Lower("username")).filter(
+            username_lower=username.lower()
+        )
+
+    def filter_email(self, email):
+        return self.alias(email_lower=Lower("email")).filter(email_lower=email.lower())
+
+
 class User(models.Model):
     username = models.CharField(max_length=50, unique=True)
     email = models.EmailField(max_length=100, unique=True)
@@ -12,11 +29,86 @@ class User(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(Lower("username"), name="user_username_lower_uniq"),
+            models.UniqueConstraint(Lower("email"), name="user_email_lower_uniq"),
+        ]
+
     def __str__(self):
         return self.username
 
 
-class Inverter(models.Model):
+class ImageStatus(models.TextChoices):
+    NONE = "", "No upload"
+    PENDING = "pending", "Uploading"
+    READY = "ready", "Uploaded"
+    FAILED = "failed", "Upload failed"
+
+
+# Storefront icon for inverters without an image; the first keyword in the
+# name wins. Stored on the row (Inverter.icon) so pages don't recompute it.
+PRODUCT_ICONS = [("Residential", "🏠"), ("Commercial", "🏢"), ("Industrial", "🏭")]
+DEFAULT_PRODUCT_ICON = "⚡"
+
+
+def product_icon(name):
+    for keyword, icon in PRODUCT_ICONS:
+        if keyword in name:
+            return icon
+    return DEFAULT_PRODUCT_ICON
+
+
+IMAGE_URL_FIELDS = {"image_url", "thumbnail_url", "image_variants"}
+
+
+class StoredImageURLsMixin:
+    """
+    Keeps ``image_url``, ``thumbnail_url`` and the derivative URLs in step
+    with ``image`` on every save, so reads never touch the storage backend.
+
+    If ``image`` is replaced without new derivatives (anything but
+    ``replace_image``, e.g. a form or the shell), the old picture's
+    derivatives are dropped so the URLs follow the new file; they are
+    rebuilt by ``build_image_derivatives``, which picks up rows without any.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_stored_image()
+        return instance
+
+    def _remember_stored_image(self):
+        # Only when both were loaded, so deferred fields aren't fetched
+        if not {"image", "image_variants"} & self.get_deferred_fields():
+            self._stored_image = (self.image.name, self.image_variants)
+
+    def _drop_stale_variants(self):
+        if not hasattr(self, "_stored_image"):
+            return
+        stored_name, stored_variants = self._stored_image
+        if self.image.name == stored_name or self.image_variants != stored_variants:
+            return
+        self.image_variants = []
+        if stored_variants:
+            storage = self.image.storage
+            transaction.on_commit(lambda: delete_derivatives(storage, stored_variants))
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"image", "image_variants"} & set(update_fields):
+            self._drop_stale_variants()
+            resolve_image_urls(self)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *IMAGE_URL_FIELDS}
+        super().save(*args, **kwargs)
+        self._remember_stored_image()
+
+
+class Inverter(StoredImageURLsMixin, models.Model):
     name = models.CharField(max_length=100)
     brand = models.CharField(max_length=100)
     model = models.CharField(max_length=100)
@@ -25,19 +117,104 @@ class Inverter(models.Model):
     output_voltage = models.CharField(max_length=50)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     image = models.ImageField(upload_to="inverters/", null=True, blank=True)  # Cloudinary stores this
+    image_variants = models.JSONField(default=list, blank=True, editable=False)  # Resized copies
+    image_url = models.CharField(max_length=500, blank=True, editable=False)  # Set on save
+    thumbnail_url = models.CharField(max_length=500, blank=True, editable=False)  # Set on save
+    image_status = models.CharField(
+        max_length=10, choices=ImageStatus.choices, default=ImageStatus.NONE, blank=True
+    )  # Set by the image uploader
     description = models.TextField()
+    icon = models.CharField(
+        max_length=4, default=DEFAULT_PRODUCT_ICON, editable=False
+    )  # Derived from name on save
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    # Kept current by a database trigger (migration 0014) on every INSERT and
+    # on UPDATEs that touch name, model or description, bulk writes included
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        constraints = [
+            # Supplier catalogs are upserted on (brand, model)
+            models.UniqueConstraint(
+                fields=["brand", "model"], name="inverter_brand_model_uniq"
+            ),
+        ]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="inverter_search_vector_gin"),
+            # Storefront, API pagination and admin filters
+            models.Index(fields=["-created_at", "-id"], name="inverter_created_id_idx"),
+            models.Index(fields=["brand"], name="inverter_brand_idx"),
+            models.Index(fields=["power_capacity_kw"], name="inverter_power_idx"),
+            # Admin icontains search compiles to UPPER(col) LIKE UPPER(%s); the
+            # search API's trigram matches use them too (see API.filters)
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="inverter_name_upper_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("brand"), name="gin_trgm_ops"),
+                name="inverter_brand_upper_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("model"), name="gin_trgm_ops"),
+                name="inverter_model_upper_trgm",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.brand} {self.model} - {self.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored summary fields so saves can apply deltas to the
+        # brand summaries, including moving an inverter to another brand
+        fields = ["brand", "price", "power_capacity_kw"]
+        if all(field in field_names for field in fields):
+            instance._loaded_summary = tuple(
+                values[field_names.index(field)] for field in fields
+            )
+        return instance
+
+    def save(self, *args, **kwargs):
+        self.icon = product_icon(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "icon"}
+        super().save(*args, **kwargs)
+
+
+class BrandSummary(models.Model):
+    """
+    Per-brand inverter statistics, updated whenever an inverter changes.
+    """
+
+    brand = models.CharField(max_length=100, unique=True)
+    inverter_count = models.PositiveIntegerField(default=0)
+    price_sum = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    price_min = models.DecimalField(max_digits=10, decimal_places=2, null=True)
+    price_max = models.DecimalField(max_digits=10, decimal_places=2, null=True)
+    power_sum = models.FloatField(default=0)
+    power_min = models.FloatField(null=True)
+    power_max = models.FloatField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.brand} ({self.inverter_count})"
 
-class HomepageSlider(models.Model):
+
+class HomepageSlider(StoredImageURLsMixin, models.Model):
     title = models.CharField(max_length=200, help_text="Main headline")
     subtitle = models.CharField(max_length=300, blank=True, help_text="Secondary text")
     description = models.TextField(blank=True, help_text="Brief description")
     image = models.ImageField(upload_to="slider/", help_text="Recommended: 1920x800px")  # Stored in Cloudinary
+    image_variants = models.JSONField(default=list, blank=True, editable=False)  # Resized copies
+    image_url = models.CharField(max_length=500, blank=True, editable=False)  # Set on save
+    thumbnail_url = models.CharField(max_length=500, blank=True, editable=False)  # Set on save
+    image_status = models.CharField(
+        max_length=10, choices=ImageStatus.choices, default=ImageStatus.NONE, blank=True
+    )  # Set by the image uploader
     # Call-to-action
     cta_text = models.CharField(max_length=50, blank=True, help_text="Button text")
     cta_link = models.URLField(blank=True, help_text="Button link")
@@ -49,5 +226,46 @@ class HomepageSlider(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at"], name="slider_created_idx"),
+            models.Index(fields=["-updated_at"], name="slider_updated_idx"),
+        ]
+
     def __str__(self):
         return self.title
+
+    @cached_property
+    def responsive_image(self):
+        if not self.image_variants:
+            return None
+        return image_sources(self.image_url, self.image_variants)
+
+
+class ImageUploadJob(models.Model):
+    """
+    An uploaded image waiting to be pushed to the storage backend.
+
+    The bytes are kept in the database so ``process_image_uploads`` can run
+    the job from any process, outside the admin request that accepted the
+    upload. Jobs are deleted as soon as the upload succeeds, so the table
+    only holds uploads that are waiting or have failed.
+    """
+
+    model = models.CharField(max_length=100)  # app_label.model_name
+    object_id = models.PositiveIntegerField()
+    filename = models.CharField(max_length=255)
+    data = models.BinaryField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    run_after = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["run_after"], name="imagejob_run_after_idx"),
+            models.Index(fields=["model", "object_id"], name="imagejob_object_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id}: {self.filename}"
@@ -0,0 +1,114 @@
+"""
+Per-request instrumentation shared by DatabaseTimingMiddleware,
+RequestProfileMiddleware and the template backend below.
+
+``profiled_request`` installs the one query timer a request gets, however
+many of these are enabled; ``add_server_timing`` appends their entries to
+the response header.
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connection
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+current_profile = ContextVar("current_profile", default=None)
+
+# Collapse IN (...) / VALUES lists so batches of any size share one shape
+_PLACEHOLDER_LIST = re.compile(r"%s(?:\s*,\s*%s)+")
+
+
+def sql_shape(sql):
+    return _PLACEHOLDER_LIST.sub("%s", sql)
+
+
+class RequestProfile:
+    def __init__(self):
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.shapes = Counter()
+
+    @property
+    def query_count(self):
+        return sum(self.shapes.values())
+
+    def record_query(self, sql, duration):
+        self.sql_time += duration
+        self.shapes[sql_shape(sql)] += 1
+
+    def repeated_shapes(self, threshold, since=None):
+        shapes = self.shapes - since if since else self.shapes
+        return [(shape, count) for shape, count in shapes.most_common() if count > threshold]
+
+
+@contextmanager
+def profiled_request():
+    """
+    Yield ``(profile, created)`` for the current request.
+
+    The outermost caller creates the profile and wraps the connection with
+    the query timer; nested callers get the same profile, so queries are
+    timed once and ``created`` is False.
+    """
+    profile = current_profile.get()
+    if profile is not None:
+        yield profile, False
+        return
+
+    profile = RequestProfile()
+    token = current_profile.set(profile)
+
+    def record_query(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            profile.record_query(sql, time.perf_counter() - started)
+
+    try:
+        with connection.execute_wrapper(record_query):
+            yield profile, True
+    finally:
+        current_profile.reset(token)
+
+
+def add_server_timing(response, timing):
+    if response.has_header("Server-Timing"):
+        timing = f"{response['Server-Timing']}, {timing}"
+    response["Server-Timing"] = timing
+
+
+class ProfiledTemplate(Template):
+    def render(self, context=None, request=None):
+        profile = current_profile.get()
+        if profile is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            profile.template_time += time.perf_counter() - started
+
+
+class ProfiledDjangoTemplates(DjangoTemplates):
+    """
+    DjangoTemplates whose top-level renders add to the current request profile.
+
+    Included and extended templates render inside the top-level one, so they
+    are counted once. Queries run by lazy querysets in a template count
+    towards both SQL and template time.
+    """
+
+    def from_string(self, template_code):
+        return ProfiledTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return ProfiledTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
@@ -0,0 +1,65 @@
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from myapp.catalog import bump_catalog_version
+from myapp.stats import (
+    SUMMARY_FIELDS,
+    apply_inverter_change,
+    refresh_brand_summary,
+    summary_values,
+)
+from myapp.models import Inverter, HomepageSlider
+
+
+@receiver(post_save, sender=Inverter)
+@receiver(post_delete, sender=Inverter)
+@receiver(post_save, sender=HomepageSlider)
+@receiver(post_delete, sender=HomepageSlider)
+def invalidate_catalog(sender, **kwargs):
+    # Bump after commit so a concurrent request can't re-cache the old rows
+    transaction.on_commit(bump_catalog_version)
+
+
+@receiver(post_save, sender=Inverter)
+def update_brand_statistics(sender, instance, created, update_fields, **kwargs):
+    # Image uploads and other saves that leave these fields alone are skipped
+    if update_fields is not None and not SUMMARY_FIELDS.intersection(update_fields):
+        return
+    new = summary_values(instance.brand, instance.price, instance.power_capacity_kw)
+    if created:
+        apply_inverter_change(None, new)
+    elif hasattr(instance, "_loaded_summary"):
+        apply_inverter_change(summary_values(*instance._loaded_summary), new)
+    else:
+        # Saved without loading it first, so the previous values are unknown
+        refresh_brand_summary(instance.brand)
+    instance._loaded_summary = new
+
+
+@receiver(post_delete, sender=Inverter)
+def remove_brand_statistics(sender, instance, **kwargs):
+    loaded = getattr(instance, "_loaded_summary", None)
+    if loaded is None:
+        loaded = (instance.brand, instance.price, instance.power_capacity_kw)
+    apply_inverter_change(summary_values(*loaded), None)
+
+
+@contextmanager
+def inverter_delete_receivers_disconnected():
+    """
+    Disconnect the Inverter post_delete receivers for a bulk delete.
+
+    Without receivers ``QuerySet.delete()`` runs as a single DELETE instead
+    of loading every row to send signals. The caller refreshes the brand
+    summaries and the catalog version afterwards.
+    """
+    receivers = [invalidate_catalog, remove_brand_statistics]
+    for receiver_func in receivers:
+        post_delete.disconnect(receiver_func, sender=Inverter)
+    try:
+        yield
+    finally:
+        for receiver_func in receivers:
+            post_delete.connect(receiver_func, sender=Inverter)
@@ -0,0 +1,85 @@
+"""
+Cold-start measurement for the serverless entry point (api/index.py).
+
+Each measurement runs in a fresh interpreter: it imports the WSGI module,
+serves one request through it and reports the timings and loaded modules
+as JSON. ``profile_startup`` and the cold-start budget test both use it.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+# Imported only by admin and API routes; the storefront must not need them
+HEAVY_MODULES = [
+    "rest_framework.views",
+    "rest_framework.serializers",
+    "cloudinary",
+    "cloudinary_storage",
+    "PIL.Image",
+    "myapp.ADMIN.products",
+    "myapp.API.inverters",
+    "myapp.uploads",
+]
+
+PROBE = """
+import json, os, sys, time
+started = time.perf_counter()
+sys.path.insert(0, os.getcwd())
+import api.index as entry
+imported = time.perf_counter()
+from wsgiref.util import setup_testing_defaults
+environ = {}
+setup_testing_defaults(environ)
+environ["PATH_INFO"] = sys.argv[1]
+environ["HTTP_HOST"] = "localhost"
+status = []
+result = entry.app(environ, lambda s, h, exc_info=None: status.append(s))
+body = b"".join(result)
+result.close()
+done = time.perf_counter()
+print(json.dumps({
+    "status": status[0],
+    "bytes": len(body),
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": (done - imported) * 1000,
+    "total_ms": (done - started) * 1000,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def measure_cold_start(path="/", importtime=False, env=None):
+    """
+    Return cold-start timings for ``path``; with ``importtime`` also the
+    per-module ``(self_us, cumulative_us, name)`` rows from ``-X importtime``.
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", PROBE, path]
+    completed = subprocess.run(
+        command,
+        cwd=settings.BASE_DIR,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    if importtime:
+        result["imports"] = parse_importtime(completed.stderr)
+    return result
+
+
+def parse_importtime(output):
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
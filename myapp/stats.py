@@ -0,0 +1,148 @@
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Sum, Value
+from django.db.models.functions import Greatest, Least
+from myapp.models import Inverter, BrandSummary
+
+# The Inverter fields the summary is built from
+SUMMARY_FIELDS = {"brand", "price", "power_capacity_kw"}
+
+
+def refresh_brand_summary(brand):
+    """
+    Recompute one brand's summary row from its (brand-indexed) inverters.
+    """
+    totals = Inverter.objects.filter(brand=brand).aggregate(
+        inverter_count=Count("id"),
+        price_sum=Sum("price"),
+        price_min=Min("price"),
+        price_max=Max("price"),
+        power_sum=Sum("power_capacity_kw"),
+        power_min=Min("power_capacity_kw"),
+        power_max=Max("power_capacity_kw"),
+    )
+    if not totals["inverter_count"]:
+        BrandSummary.objects.filter(brand=brand).delete()
+        return None
+
+    totals["price_sum"] = totals["price_sum"] or 0
+    totals["power_sum"] = totals["power_sum"] or 0
+    summary, _ = BrandSummary.objects.update_or_create(brand=brand, defaults=totals)
+    return summary
+
+
+def summary_values(brand, price, power_capacity_kw):
+    """
+    Normalise one inverter's summary fields, which may still be form strings.
+    """
+    price = Decimal(str(price)).quantize(Decimal("0.01"))
+    return (brand, price, float(power_capacity_kw))
+
+
+def apply_inverter_change(old, new):
+    """
+    Fold one inverter's insert, update or delete into the summary table.
+
+    ``old`` and ``new`` are ``summary_values`` tuples, or None for an insert
+    or delete. Counts and sums take deltas in place; a brand is re-aggregated
+    only when the removed values were its minimum or maximum, as those can't
+    be undone by a delta.
+    """
+    if old == new:
+        return
+    with transaction.atomic():
+        if old is not None and not remove_from_summary(*old):
+            # The recount already sees the new values if the brand is the same
+            refresh_brand_summary(old[0])
+            if new is not None and new[0] == old[0]:
+                return
+        if new is not None:
+            add_to_summary(*new)
+
+
+def add_to_summary(brand, price, power):
+    deltas = {
+        "inverter_count": F("inverter_count") + 1,
+        "price_sum": F("price_sum") + price,
+        "price_min": Least(F("price_min"), Value(price)),
+        "price_max": Greatest(F("price_max"), Value(price)),
+        "power_sum": F("power_sum") + power,
+        "power_min": Least(F("power_min"), Value(power)),
+        "power_max": Greatest(F("power_max"), Value(power)),
+    }
+    if BrandSummary.objects.filter(brand=brand).update(**deltas):
+        return
+    try:
+        with transaction.atomic():
+            BrandSummary.objects.create(
+                brand=brand,
+                inverter_count=1,
+                price_sum=price,
+                price_min=price,
+                price_max=price,
+                power_sum=power,
+                power_min=power,
+                power_max=power,
+            )
+    except IntegrityError:
+        # Another writer created the brand's row first
+        BrandSummary.objects.filter(brand=brand).update(**deltas)
+
+
+def remove_from_summary(brand, price, power):
+    """
+    Subtract one inverter from its brand; False if a recount is needed.
+    """
+    summary = BrandSummary.objects.select_for_update().filter(brand=brand).first()
+    if (
+        summary is None
+        or summary.inverter_count <= 1
+        or price in (summary.price_min, summary.price_max)
+        or power in (summary.power_min, summary.power_max)
+    ):
+        return False
+    BrandSummary.objects.filter(pk=summary.pk).update(
+        inverter_count=F("inverter_count") - 1,
+        price_sum=F("price_sum") - price,
+        power_sum=F("power_sum") - power,
+    )
+    return True
+
+
+def refresh_brand_summaries(brands=None):
+    """
+    Refresh the given brands, or rebuild the whole table when brands is None.
+    """
+    if brands is None:
+        brands = set(Inverter.objects.values_list("brand", flat=True).distinct())
+        BrandSummary.objects.exclude(brand__in=brands).delete()
+    for brand in set(brands):
+        refresh_brand_summary(brand)
+
+
+def get_dashboard_stats():
+    """
+    Build the dashboard figures from the summary table alone.
+    """
+    brands = list(BrandSummary.objects.order_by("-inverter_count", "brand"))
+
+    count = sum(b.inverter_count for b in brands)
+    price_sum = sum(b.price_sum for b in brands)
+    power_sum = sum(b.power_sum for b in brands)
+
+    for b in brands:
+        b.price_avg = b.price_sum / b.inverter_count
+        b.power_avg = b.power_sum / b.inverter_count
+
+    return {
+        "inverter_count": count,
+        "brand_count": len(brands),
+        "price_avg": price_sum / count if count else None,
+        "price_min": min((b.price_min for b in brands), default=None),
+        "price_max": max((b.price_max for b in brands), default=None),
+        "power_avg": power_sum / count if count else None,
+        "power_min": min((b.power_min for b in brands), default=None),
+        "power_max": max((b.power_max for b in brands), default=None),
+        "brands": brands,
+    }
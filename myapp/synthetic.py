@@ -0,0 +1,192 @@
+"""
+Synthetic catalog, slider and user data for scale testing.
+
+Every batch draws from its own generator seeded with ``(seed, kind, batch)``,
+so the output is identical for a given seed however the batches are spread
+across worker processes. Rows get fixed ``SYN-``/``synthetic`` keys and are
+written with ``ignore_conflicts``, so a re-run only fills in missing rows;
+``generate_data --clear`` removes them to rebuild with another seed.
+"""
+
+import random
+import string
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+# (brand, market share weight, price multiplier)
+BRANDS = [
+    ("SunVolt", 18, 1.00),
+    ("Helion", 14, 1.15),
+    ("GridMax", 12, 0.90),
+    ("Voltaris", 10, 1.25),
+    ("PowerNova", 9, 0.85),
+    ("Solaria", 8, 1.05),
+    ("Ampere Works", 7, 0.95),
+    ("Photon Systems", 6, 1.35),
+    ("Lumen Energy", 5, 1.10),
+    ("Zenith Power", 4, 1.50),
+    ("Kestrel", 4, 0.80),
+    ("Brightline", 3, 1.00),
+]
+
+# (segment, weight, (min kW, max kW), input voltages, output voltages, USD per kW)
+SEGMENTS = [
+    (
+        "Residential",
+        70,
+        (1.0, 15.0),
+        ["48V DC", "120-500V DC"],
+        ["230V", "120/240V"],
+        (180, 420),
+    ),
+    (
+        "Commercial",
+        25,
+        (15.0, 150.0),
+        ["200-800V DC", "600V DC"],
+        ["400V 3-phase", "480V 3-phase"],
+        (90, 220),
+    ),
+    (
+        "Industrial",
+        5,
+        (150.0, 500.0),
+        ["600-1500V DC"],
+        ["480V 3-phase", "690V 3-phase"],
+        (60, 140),
+    ),
+]
+
+SERIES = ["Home", "Hybrid", "String", "Pro", "Max", "Grid-Tie", "Off-Grid", "Central"]
+FEATURES = [
+    "MPPT tracking",
+    "battery-ready hybrid operation",
+    "IP65 outdoor enclosure",
+    "Wi-Fi monitoring",
+    "rapid shutdown compliance",
+    "reactive power control",
+    "fanless cooling",
+    "dual MPPT inputs",
+]
+
+PLACEHOLDER_COLORS = ["#1f6f8b", "#99a8b2", "#e6a400", "#2d4059", "#ea5455"]
+
+MODEL_PREFIX = "SYN-"
+USERNAME_PREFIX = "synthetic"
+SLIDE_TITLE_PREFIX = "Synthetic slide "
+PASSWORD_TEMPLATE = "synthetic-{index}"
+
+# Row i is dated i minutes before this, so timestamps don't depend on the run
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def batch_rng(seed, kind, batch):
+    # String seeds are hashed with SHA-512, so this is stable across runs
+    return random.Random(f"{seed}:{kind}:{batch}")
+
+
+def inverter_batch(seed, batch, start, count):
+    """
+    Return field dicts for inverters ``start`` .. ``start + count - 1``.
+    """
+    rng = batch_rng(seed, "inverter", batch)
+    brands, brand_weights = zip(*[((name, mult), weight) for name, weight, mult in BRANDS])
+    segment_weights = [segment[1] for segment in SEGMENTS]
+    rows = []
+    for index in range(start, start + count):
+        brand, multiplier = rng.choices(brands, brand_weights)[0]
+        segment, _, (low, high), inputs, outputs, per_kw = rng.choices(
+            SEGMENTS, segment_weights
+        )[0]
+        # Ratings cluster at the low end of each segment
+        power = round(low + (high - low) * rng.random() ** 2, 1)
+        price = Decimal(round(power * rng.uniform(*per_kw) * multiplier, 2)).quantize(
+            Decimal("0.01")
+        )
+        series = rng.choice(SERIES)
+        rows.append(
+            {
+                "name": f"{segment} {series} {power:g}kW Inverter",
+                "brand": brand,
+                "model": f"{MODEL_PREFIX}{index:08d}",
+                "power_capacity_kw": power,
+                "input_voltage": rng.choice(inputs),
+                "output_voltage": rng.choice(outputs),
+                "price": price,
+                "description": (
+                    f"{power:g} kW {segment.lower()} {series.lower()} inverter from "
+                    f"{brand} with {' and '.join(rng.sample(FEATURES, 2))}."
+                ),
+                "created_at": EPOCH - timedelta(minutes=index),
+            }
+        )
+    return rows
+
+
+def user_batch(seed, batch, start, count, iterations=None):
+    """
+    Return ``(username, email, password_hash)`` tuples; run in worker processes.
+
+    The password for user ``i`` is ``PASSWORD_TEMPLATE.format(index=i)``.
+    Salts come from the batch generator, so hashes are reproducible too.
+    """
+    rng = batch_rng(seed, "user", batch)
+    hasher = get_hasher("default")
+    kwargs = {"iterations": iterations} if iterations else {}
+    alphabet = string.ascii_letters + string.digits
+    rows = []
+    for index in range(start, start + count):
+        salt = "".join(rng.choices(alphabet, k=22))
+        password = hasher.encode(PASSWORD_TEMPLATE.format(index=index), salt, **kwargs)
+        username = f"{USERNAME_PREFIX}{index}"
+        rows.append((username, f"{username}@example.com", password))
+    return rows
+
+
+def placeholder_images(count, width=1920, height=800):
+    """
+    Store ``count`` solid-color slide images once and return their names.
+    """
+    # Pillow is only needed here, not on page views
+    from PIL import Image, ImageDraw
+
+    names = []
+    for index in range(count):
+        name = f"slider/synthetic-placeholder-{index}.jpg"
+        if not default_storage.exists(name):
+            color = PLACEHOLDER_COLORS[index % len(PLACEHOLDER_COLORS)]
+            image = Image.new("RGB", (width, height), color)
+            ImageDraw.Draw(image).text((40, 40), f"Placeholder {index + 1}", fill="white")
+            buffer = BytesIO()
+            image.save(buffer, "JPEG", quality=70)
+            name = default_storage.save(name, ContentFile(buffer.getvalue()))
+        names.append(name)
+    return names
+
+
+def slider_rows(seed, count, image_names, start=0):
+    # Drawn for every slide so rows after ``start`` match a full run
+    rng = batch_rng(seed, "slider", 0)
+    # Internal pages are reversed by URL name, so only real public ones
+    pages = ["index", ""]
+    # bulk_create skips save(), so the stored image URLs are filled in here
+    urls = [default_storage.url(name) for name in image_names]
+    return [
+        {
+            "title": f"{SLIDE_TITLE_PREFIX}{index + 1}",
+            "subtitle": rng.choice(["Save on energy", "Go solar today", "Built to last"]),
+            "description": f"Placeholder slide {index + 1} for scale testing.",
+            "image": image_names[index % len(image_names)],
+            "image_url": urls[index % len(urls)],
+            "thumbnail_url": urls[index % len(urls)],
+            "cta_text": "Shop now",
+            "cta_internal_page": rng.choice(pages),
+        }
+        for index in range(count)
+    ][start:]
+
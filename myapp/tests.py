@@ -1,3 +1,1014 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import quote, urlencode, urlunsplit
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.db.models import Count, Q
+from django.http import HttpResponse
+from django.db.models.signals import post_delete
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from django.utils.module_loading import import_string
+from myapp.benchmarks import authenticate, compare
+from myapp.catalog_import import CatalogImporter
+from myapp.ADMIN.productexport import EXPORT_FIELDS
+from myapp.API.filters import filter_inverter_text
+from myapp.catalog import (
+    build_storefront_payload,
+    get_catalog_version,
+    get_storefront_payload,
+)
+from myapp.db_backend.base import DatabaseWrapper
+from myapp.lazyviews import lazy_view
+from myapp.management.commands.generate_data import Command as GenerateData
+from myapp.middleware.auth_middleware import AuthMiddleware
+from myapp.middleware.db_timing import DatabaseTimingMiddleware
+from myapp.middleware.page_cache import AnonymousPageCacheMiddleware
+from myapp.middleware.request_profile import RequestProfileMiddleware
+from myapp.models import (
+    BrandSummary,
+    HomepageSlider,
+    ImageStatus,
+    ImageUploadJob,
+    Inverter,
+    User,
+)
+from myapp.synthetic import inverter_batch, user_batch
+from myapp.startup import HEAVY_MODULES, measure_cold_start
+from myapp.stats import refresh_brand_summaries
+from myapp.throttle import LoginThrottle, client_ip
+from myapp.uploads import process_job, queue_image_upload
+from myapp.validation import validate_inverter_data
+
+
+def make_inverter(**fields):
+    defaults = dict(
+        name="Residential 5kW", brand="B", model="R1", power_capacity_kw=5,
+        price=Decimal("1500"), input_voltage="48V", output_voltage="230V",
+        description="Text",
+    )
+    return Inverter.objects.create(**{**defaults, **fields})
+
+
+# No collectstatic manifest in tests
+without_static_manifest = override_settings(
+    STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage"
+)
+
+
+class QueryPlanTests(TestCase):
+    """
+    Guard the hot query paths against silently falling back to sequential scans.
+
+    A synthetic catalog large enough for the planner to prefer indexes is
+    seeded once, then each query shape used by the storefront, the catalog
+    API and the admin is run through EXPLAIN.
+    """
+
+    INVERTER_ROWS = 20000
+    SLIDER_ROWS = 2000
+    USER_ROWS = 5000
+    BRANDS = [f"Brand{i:02d}" for i in range(40)]
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(1234)
+        now = timezone.now()
+
+        Inverter.objects.bulk_create(
+            [
+                Inverter(
+                    name=f"{rng.choice(['Residential', 'Commercial', 'Industrial'])} Inverter {i}",
+                    brand=rng.choice(cls.BRANDS),
+                    model=f"{rng.getrandbits(40):010X}",
+                    power_capacity_kw=rng.randint(1, 500) / 2,
+                    input_voltage="230V",
+                    output_voltage="230V",
+                    price=Decimal(rng.randint(100, 50000)),
+                    description=f"Synthetic inverter number {i}",
+                    created_at=now - timedelta(minutes=i),
+                )
+                for i in range(cls.INVERTER_ROWS)
+            ],
+            batch_size=2000,
+        )
+
+        HomepageSlider.objects.bulk_create(
+            [
+                HomepageSlider(title=f"Slide {i}", image=f"slider/slide-{i}.jpg")
+                for i in range(cls.SLIDER_ROWS)
+            ],
+            batch_size=2000,
+        )
+
+        User.objects.bulk_create(
+            [
+                User(
+                    username=f"User{i}",
+                    email=f"user{i}@example.com",
+                    password="!",
+                )
+                for i in range(cls.USER_ROWS)
+            ],
+            batch_size=2000,
+        )
+
+        with connection.cursor() as cursor:
+            # VACUUM can't run inside the test transaction, so merge the GIN
+            # pending lists by hand before the planner looks at them
+            cursor.execute(
+                "SELECT gin_clean_pending_list(indexrelid) FROM pg_index "
+                "JOIN pg_class ON pg_class.oid = indexrelid "
+                "JOIN pg_am ON pg_am.oid = pg_class.relam "
+                "WHERE indrelid = %s::regclass AND amname = 'gin'",
+                [Inverter._meta.db_table],
+            )
+            cursor.execute(f"ANALYZE {Inverter._meta.db_table}")
+            cursor.execute(f"ANALYZE {HomepageSlider._meta.db_table}")
+            cursor.execute(f"ANALYZE {User._meta.db_table}")
+
+    def assertIndexBacked(self, queryset):
+        plan = queryset.explain()
+        self.assertNotIn("Seq Scan", plan, f"\n{queryset.query}\n{plan}")
+
+    def test_storefront_newest_inverters(self):
+        self.assertIndexBacked(Inverter.objects.order_by("-created_at")[:50])
+
+    def test_api_keyset_page(self):
+        pivot = Inverter.objects.order_by("-created_at", "-id")[500]
+        self.assertIndexBacked(
+            Inverter.objects.filter(
+                Q(created_at__lt=pivot.created_at)
+                | Q(created_at=pivot.created_at, id__lt=pivot.id)
+            ).order_by("-created_at", "-id")[:51]
+        )
+
+    def test_storefront_sliders(self):
+        self.assertIndexBacked(HomepageSlider.objects.order_by("-created_at")[:20])
+
+    def test_admin_sliders(self):
+        self.assertIndexBacked(HomepageSlider.objects.order_by("-updated_at")[:20])
+
+    def test_admin_brand_filter(self):
+        self.assertIndexBacked(Inverter.objects.filter(brand="Brand07"))
+
+    def test_admin_power_filter(self):
+        self.assertIndexBacked(Inverter.objects.filter(power_capacity_kw=125.0))
+
+    def test_admin_search(self):
+        term = Inverter.objects.order_by("id").values_list("model", flat=True)[123]
+        model_admin = admin.site._registry[Inverter]
+        request = RequestFactory().get("/admin/myapp/inverter/", {"q": term})
+        queryset, _ = model_admin.get_search_results(
+            request, Inverter.objects.all(), term
+        )
+        self.assertIndexBacked(queryset)
+
+    def test_search_text(self):
+        self.assertIndexBacked(
+            Inverter.objects.filter(search_vector=SearchQuery("number 12345"))
+        )
+
+    def test_search_typo_match(self):
+        self.assertIndexBacked(
+            filter_inverter_text(Inverter.objects.all(), "Industrail Invertr 1234")
+        )
+
+    def test_search_brand_facets(self):
+        self.assertIndexBacked(
+            Inverter.objects.filter(power_capacity_kw__lte=2)
+            .values("brand")
+            .annotate(count=Count("id"))
+        )
+
+    def test_login_username_lookup(self):
+        self.assertIndexBacked(
+            User.objects.only("id", "username", "email", "password").filter_username(
+                "USER1234"
+            )
+        )
+
+    def test_register_email_lookup(self):
+        self.assertIndexBacked(User.objects.filter_email("User1234@Example.com"))
+
+
+def probe_database_url():
+    # The inverse of how settings parse DATABASE_URL; socket directories
+    # go in the query string, as libpq expects
+    db = connection.settings_dict
+    options = {k: v for k, v in db["OPTIONS"].items() if isinstance(v, str)}
+    host = db["HOST"] or ""
+    if host.startswith("/"):
+        options["host"], host = host, ""
+    credentials = quote(db["USER"] or "", safe="")
+    if db["PASSWORD"]:
+        credentials += f":{quote(db['PASSWORD'], safe='')}"
+    netloc = f"{credentials}@{host}" if credentials else host
+    return urlunsplit(("postgresql", netloc, f"/{db['NAME']}", urlencode(options), ""))
+
+
+class ColdStartTests(SimpleTestCase):
+    """
+    Keep the storefront's first request on a fresh instance cheap: the
+    admin, the API and the image/storage SDKs must stay unimported.
+    """
+
+    # Generous for shared CI machines; tighten locally via the environment
+    BUDGET_MS = float(os.getenv("COLD_START_BUDGET_MS", "2000"))
+
+    def test_storefront_cold_start(self):
+        # The probe is a separate process, so point it at the test database
+        result = measure_cold_start("/", env={"DATABASE_URL": probe_database_url()})
+
+        self.assertEqual(result["status"], "200 OK")
+        loaded = [name for name in HEAVY_MODULES if name in result["modules"]]
+        self.assertEqual(loaded, [], "Heavy modules imported on a storefront cold start")
+        self.assertLess(result["total_ms"], self.BUDGET_MS)
+
+    def test_lazy_view_forwards_csrf_exempt_only(self):
+        view = lazy_view("myapp.API.inverters.InverterList")
+        with mock.patch("myapp.lazyviews.import_string", wraps=import_string) as load:
+            # Reversing the URLconf probes this on every route
+            self.assertFalse(hasattr(view, "view_class"))
+            load.assert_not_called()
+            self.assertTrue(view.csrf_exempt)
+            load.assert_called_once_with("myapp.API.inverters.InverterList")
+
+
+class SearchVectorTests(TestCase):
+    def matches(self, text):
+        return set(
+            Inverter.objects.filter(search_vector=SearchQuery(text)).values_list(
+                "model", flat=True
+            )
+        )
+
+    def test_bulk_writes_keep_the_vector_current(self):
+        common = dict(
+            brand="B", power_capacity_kw=5, input_voltage="48V",
+            output_voltage="230V", price=Decimal("1500"),
+        )
+        Inverter.objects.bulk_create(
+            [Inverter(name="Hybrid inverter", model="H1", description="Rooftop", **common)]
+        )
+        self.assertEqual(self.matches("hybrid"), {"H1"})
+
+        Inverter.objects.filter(model="H1").update(description="Marine grade")
+        self.assertEqual(self.matches("marine"), {"H1"})
+        self.assertEqual(self.matches("rooftop"), set())
+
+        inverter = Inverter.objects.get(model="H1")
+        inverter.price = Decimal("1400")
+        inverter.save(update_fields=["price"])
+        self.assertEqual(self.matches("marine"), {"H1"})
+
+
+class InverterAPITests(TestCase):
+    def test_malformed_cursor_is_a_bad_request(self):
+        for cursor in ["not-base64!", "bm8tc2VwYXJhdG9y", "eHx5"]:
+            response = self.client.get("/api/inverters/", {"cursor": cursor})
+            self.assertEqual(response.status_code, 400, cursor)
+            self.assertEqual(response.json(), {"cursor": ["Invalid cursor"]})
+
+
+    def test_search_ranks_filters_and_counts_facets(self):
+        make_inverter(name="Hybrid Solar Inverter", brand="A", model="H1", price=900)
+        make_inverter(name="Solar Charger", brand="A", model="C1", price=300,
+                      description="Pairs with a solar inverter")
+        make_inverter(name="Solar Inverter Pro", brand="B", model="P1", price=2500)
+        make_inverter(name="Battery", brand="B", model="B1", price=800)
+
+        response = self.client.get("/api/inverters/search/", {"q": "solar inverter"})
+        body = response.json()
+        models = [r["model"] for r in body["results"]]
+        # Name matches outrank the description-only match
+        self.assertEqual((sorted(models[:2]), models[2:]), (["H1", "P1"], ["C1"]))
+        self.assertEqual(
+            body["facets"]["brand"],
+            [{"brand": "A", "count": 2}, {"brand": "B", "count": 1}],
+        )
+        self.assertEqual(body["count"], 3)
+
+        # Typos still match by trigram; the brand filter leaves facets alone
+        response = self.client.get(
+            "/api/inverters/search/",
+            {"q": "Solar Invertr Pro", "brand": "B", "price_max": "3000"},
+        )
+        body = response.json()
+        self.assertEqual([r["model"] for r in body["results"]], ["P1"])
+        self.assertEqual(body["count"], 1)
+        self.assertEqual(
+            [f["brand"] for f in body["facets"]["brand"]], ["A", "B"]
+        )
+
+
+class InverterValidationTests(TestCase):
+    data = {
+        "name": "Residential 5kW", "brand": "B", "model": "R1",
+        "power_capacity_kw": "5", "input_voltage": "48V",
+        "output_voltage": "230V", "price": "1500", "description": "Text",
+    }
+
+    def test_duplicate_brand_and_model(self):
+        inverter = Inverter.objects.create(**self.data)
+        self.assertEqual(validate_inverter_data(self.data), [])
+        self.assertEqual(
+            validate_inverter_data(self.data, check_unique=True),
+            ["An inverter with brand B and model R1 already exists."],
+        )
+        self.assertEqual(
+            validate_inverter_data(self.data, check_unique=True, instance_id=inverter.id),
+            [],
+        )
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_failed_connections_are_not_pooled(self):
+        settings_dict = {**connection.settings_dict, "POOL": {"max_idle": 2}}
+        wrapper = DatabaseWrapper(settings_dict, alias=connection.alias)
+        pool = wrapper.pool
+        try:
+            wrapper.ensure_connection()
+            wrapper.close()
+            self.assertEqual(pool.idle.qsize(), 1)
+
+            wrapper.ensure_connection()
+            self.assertEqual(pool.idle.qsize(), 0)
+            wrapper.errors_occurred = True
+            wrapper.close()
+            self.assertEqual(pool.idle.qsize(), 0)
+        finally:
+            pool.close_all()
+
+
+class RequestProfileTests(TestCase):
+    @override_settings(REQUEST_PROFILE_REPEAT_THRESHOLD=2)
+    def test_repeated_query_shape_is_flagged(self):
+        def view(request):
+            # One lookup per id is the N+1 shape; the IN query is not
+            for pk in range(3):
+                Inverter.objects.filter(pk=pk).first()
+            list(Inverter.objects.filter(pk__in=[1, 2, 3]))
+            return HttpResponse()
+
+        middleware = RequestProfileMiddleware(view)
+        with self.assertLogs("myapp.middleware.request_profile", "INFO") as logs:
+            response = middleware(RequestFactory().get("/"))
+
+        self.assertIn('sql;dur=', response["Server-Timing"])
+        self.assertIn('desc="4 queries"', response["Server-Timing"])
+        self.assertIn('n1;desc="1 repeated shapes"', response["Server-Timing"])
+        warnings = [line for line in logs.output if line.startswith("WARNING")]
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("ran 3 times", warnings[0])
+
+    def test_stacked_middleware_times_queries_once(self):
+        def view(request):
+            list(Inverter.objects.all())
+            return HttpResponse()
+
+        middleware = DatabaseTimingMiddleware(RequestProfileMiddleware(view))
+        with mock.patch("myapp.profiling.RequestProfile.record_query") as record:
+            response = middleware(RequestFactory().get("/"))
+
+        self.assertEqual(record.call_count, 1)
+        timing = response["Server-Timing"]
+        self.assertIn("db-query;", timing)
+        self.assertIn("view;dur=", timing)
+        self.assertNotIn("sql;", timing)
+
+    def test_page_cache_does_not_replay_timings(self):
+        def view(request):
+            response = HttpResponse("page")
+            response["Server-Timing"] = "view;dur=1.0"
+            return response
+
+        middleware = AnonymousPageCacheMiddleware(view)
+        with self.settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }):
+            cache.clear()
+            first = middleware(RequestFactory().get("/"))
+            second = middleware(RequestFactory().get("/"))
+        self.assertEqual(first["Server-Timing"], "view;dur=1.0")
+        self.assertFalse(second.has_header("Server-Timing"))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    PAGE_CACHE_QUERY_PARAMS=["lang"],
+)
+class PageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.renders = 0
+
+        def view(request):
+            self.renders += 1
+            response = HttpResponse(f"render {self.renders}")
+            response["ETag"] = f'"{self.renders}"'
+            return response
+
+        self.middleware = AnonymousPageCacheMiddleware(view)
+
+    def get(self, path, **headers):
+        return self.middleware(RequestFactory().get(path, **headers)).content.decode()
+
+    def wait_for_rebuilds(self):
+        for thread in threading.enumerate():
+            if thread.name.startswith("page-cache-rebuild"):
+                thread.join()
+
+    def test_unknown_query_params_share_the_entry(self):
+        self.assertEqual(self.get("/"), "render 1")
+        self.assertEqual(self.get("/?x=123"), "render 1")
+        self.assertEqual(self.get("/?lang=de&utm=1"), "render 2")
+        self.assertEqual(self.get("/?lang=de"), "render 2")
+
+    def test_stale_entry_is_served_while_rebuilt_in_the_background(self):
+        self.assertEqual(self.get("/"), "render 1")
+        later = time.time() + settings.PAGE_CACHE_SOFT_TTL + 1
+        with mock.patch("myapp.middleware.page_cache.time.time", return_value=later):
+            self.assertEqual(self.get("/"), "render 1")
+            self.wait_for_rebuilds()
+        self.assertEqual(self.get("/"), "render 2")
+
+    def test_conditional_hits_trigger_the_rebuild_too(self):
+        self.get("/")
+        later = time.time() + settings.PAGE_CACHE_SOFT_TTL + 1
+        with mock.patch("myapp.middleware.page_cache.time.time", return_value=later):
+            request = RequestFactory().get("/", HTTP_IF_NONE_MATCH='"1"')
+            self.assertEqual(self.middleware(request).status_code, 304)
+            self.wait_for_rebuilds()
+        self.assertEqual(self.renders, 2)
+        self.assertEqual(self.get("/"), "render 2")
+
+
+def png_bytes(color, size=(400, 200)):
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class ImageUploadTests(TestCase):
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        storage = override_settings(
+            DEFAULT_FILE_STORAGE="django.core.files.storage.FileSystemStorage",
+            MEDIA_ROOT=self.media,
+        )
+        storage.enable()
+        self.addCleanup(storage.disable)
+
+    def stored_files(self):
+        return [name for _, _, names in os.walk(self.media) for name in names]
+
+    def test_admin_save_only_queues_the_upload(self):
+        authenticate(self.client)
+        upload = SimpleUploadedFile("a.png", png_bytes("orange"), "image/png")
+        fields = dict(
+            name="Residential 5kW", brand="B", model="R1", power_capacity_kw=5,
+            price="1500", input_voltage="48V", output_voltage="230V",
+            description="Text",
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/products/", {**fields, "image": upload})
+        self.assertRedirects(response, "/products/", fetch_redirect_response=False)
+
+        inverter = Inverter.objects.get(model="R1")
+        self.assertEqual(inverter.image_status, ImageStatus.PENDING)
+        self.assertFalse(inverter.image)
+        self.assertEqual(self.stored_files(), [])
+        self.assertEqual(ImageUploadJob.objects.get().object_id, inverter.pk)
+
+        call_command("process_image_uploads", stdout=io.StringIO())
+        inverter.refresh_from_db()
+        self.assertEqual(inverter.image_status, ImageStatus.READY)
+        self.assertTrue(inverter.image_url.endswith("-400w.jpeg"))
+        self.assertFalse(ImageUploadJob.objects.exists())
+
+    def test_replacing_the_image_directly_drops_stale_variants(self):
+        inverter = make_inverter()
+        queue_image_upload(inverter, SimpleUploadedFile("red.png", png_bytes("red")))
+        call_command("process_image_uploads", stdout=io.StringIO())
+        inverter = Inverter.objects.get(pk=inverter.pk)
+        self.assertTrue(inverter.image_url.endswith("red-400w.jpeg"))
+        storage = inverter.image.storage
+        blue = storage.save("inverters/blue.png", ContentFile(png_bytes("blue")))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            inverter.image = blue
+            inverter.save()
+        self.assertEqual(inverter.image_variants, [])
+        self.assertEqual(inverter.image_url, storage.url(blue))
+        self.assertEqual(inverter.thumbnail_url, storage.url(blue))
+        self.assertEqual(sorted(self.stored_files()), ["blue.png", "red.png"])
+
+        call_command("build_image_derivatives", stdout=io.StringIO())
+        inverter.refresh_from_db()
+        self.assertTrue(inverter.image_url.endswith("blue-400w.jpeg"))
+
+    @without_static_manifest
+    def test_django_admin_image_edit_updates_stored_urls(self):
+        admin_user = get_user_model().objects.create_superuser("root", "r@x.com", "pw")
+        self.client.force_login(admin_user)
+        inverter = make_inverter()
+        queue_image_upload(inverter, SimpleUploadedFile("red.png", png_bytes("red")))
+        call_command("process_image_uploads", stdout=io.StringIO())
+        inverter.refresh_from_db()
+        red_files = [v["name"] for v in inverter.image_variants]
+
+        fields = {
+            field: getattr(inverter, field)
+            for field in [
+                "name", "brand", "model", "power_capacity_kw", "input_voltage",
+                "output_voltage", "price", "description",
+            ]
+        }
+        upload = SimpleUploadedFile("blue.png", png_bytes("blue", (300, 150)))
+        response = self.client.post(
+            f"/admin/myapp/inverter/{inverter.pk}/change/",
+            {**fields, "image": upload, "_save": "Save"},
+        )
+        self.assertEqual(response.status_code, 302)
+        inverter.refresh_from_db()
+        # The current picture stays up until the queued upload is stored
+        self.assertEqual(inverter.image_status, ImageStatus.PENDING)
+        self.assertTrue(inverter.image_url.endswith("red-400w.jpeg"))
+
+        call_command("process_image_uploads", stdout=io.StringIO())
+        inverter.refresh_from_db()
+        self.assertTrue(inverter.image.name.endswith("blue.png"))
+        self.assertTrue(inverter.image_url.endswith("blue-300w.jpeg"))
+        self.assertTrue(inverter.thumbnail_url.endswith("blue-300w.jpeg"))
+        storage = inverter.image.storage
+        self.assertFalse(any(storage.exists(name) for name in red_files))
+
+    def test_failed_upload_removes_stored_files(self):
+        inverter = make_inverter()
+        job = ImageUploadJob.objects.create(
+            model="myapp.inverter", object_id=inverter.pk, filename="a.png",
+            data=png_bytes("orange"),
+        )
+
+        with mock.patch.object(Inverter, "save", side_effect=DatabaseError("down")):
+            self.assertFalse(process_job(job.pk))
+
+        self.assertEqual(self.stored_files(), [])
+        job.refresh_from_db()
+        self.assertEqual((job.attempts, job.last_error), (1, "down"))
+        self.assertGreater(job.run_after, timezone.now())
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class LoginThrottleTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.throttle = LoginThrottle({"ip": (3, 30), "username": (2, 20)})
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_client_ip_ignores_spoofed_forwarded_entries(self):
+        request = RequestFactory().get(
+            "/", HTTP_X_FORWARDED_FOR="1.2.3.4, 203.0.113.7", REMOTE_ADDR="10.0.0.1"
+        )
+        self.assertEqual(client_ip(request), "203.0.113.7")
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(client_ip(request), "10.0.0.1")
+
+    @override_settings(TRUSTED_PROXY_COUNT=0)
+    def test_client_ip_without_proxies(self):
+        request = RequestFactory().get(
+            "/", HTTP_X_FORWARDED_FOR="1.2.3.4", REMOTE_ADDR="10.0.0.1"
+        )
+        self.assertEqual(client_ip(request), "10.0.0.1")
+
+    def test_lockout_and_refill(self):
+        now = 1000.0
+        with mock.patch("myapp.throttle.time.time", side_effect=lambda: now):
+            for _ in range(2):
+                self.assertEqual(self.throttle.check("1.1.1.1", "Admin"), 0)
+                self.throttle.failure("1.1.1.1", "admin")
+            # Usernames are case-insensitive; one token refills every 10s
+            self.assertAlmostEqual(self.throttle.check("2.2.2.2", "ADMIN"), 10)
+            self.assertEqual(self.throttle.check("2.2.2.2", "other"), 0)
+            # The third failure empties the IP bucket, whatever the username
+            self.throttle.failure("1.1.1.1", "someone")
+            self.assertAlmostEqual(self.throttle.check("1.1.1.1", "other"), 10)
+
+            now += 10
+            self.assertEqual(self.throttle.check("1.1.1.1", "other"), 0)
+            self.assertEqual(self.throttle.check("2.2.2.2", "admin"), 0)
+            self.throttle.failure("2.2.2.2", "admin")
+            self.assertGreater(self.throttle.check("2.2.2.2", "admin"), 0)
+            self.throttle.success("2.2.2.2", "admin")
+            self.assertEqual(self.throttle.check("2.2.2.2", "admin"), 0)
+
+
+class BenchmarkBudgetTests(SimpleTestCase):
+    baseline = {"routes": {"storefront": {"p95_ms": 10.0}, "login": {"p95_ms": 1.0}}}
+
+    def route(self, p95_ms, errors=0):
+        return {"p95_ms": p95_ms, "errors": errors}
+
+    def test_regression_past_budget_fails(self):
+        results = {"routes": {"storefront": self.route(12.5), "login": self.route(1.0)}}
+        regressions = compare(results, self.baseline, budget=0.2)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("storefront: p95 12.50 ms"))
+
+    def test_noise_and_new_routes_pass(self):
+        # Doubling a 1 ms p95 is within the slack; routes without a baseline pass
+        results = {"routes": {"login": self.route(2.0), "slider-admin": self.route(50.0)}}
+        self.assertEqual(compare(results, self.baseline, budget=0.2), [])
+
+    def test_errors_fail(self):
+        results = {"routes": {"storefront": self.route(9.0, errors=3)}}
+        self.assertEqual(
+            compare(results, self.baseline, budget=0.2),
+            ["storefront: 3 unexpected responses"],
+        )
+
+
+class GenerateDataClearTests(TestCase):
+    def test_clear_only_removes_generated_rows(self):
+        make_inverter(model="SYN-0000001")
+        make_inverter(model="R1", price=Decimal("700"))
+        User.objects.bulk_create(
+            [
+                User(username=username, email=email, password="!")
+                for username, email in [
+                    ("synthetic3", "synthetic3@example.com"),
+                    ("synthetic_fan", "fan@example.com"),
+                    ("synthetic7", "seven@example.org"),
+                ]
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            GenerateData(stdout=io.StringIO()).clear()
+        inverter_queries = [
+            q["sql"] for q in queries if '"myapp_inverter"' in q["sql"]
+        ]
+        # A fast delete: no SELECT of the rows first, just the recount after
+        self.assertTrue(inverter_queries[0].startswith("DELETE"))
+        self.assertTrue(post_delete.has_listeners(Inverter))
+
+        self.assertEqual(list(Inverter.objects.values_list("model", flat=True)), ["R1"])
+        self.assertEqual(
+            sorted(User.objects.values_list("username", flat=True)),
+            ["synthetic7", "synthetic_fan"],
+        )
+        summary = BrandSummary.objects.get(brand="B")
+        self.assertEqual((summary.inverter_count, summary.price_sum), (1, 700))
+
+
+class SyntheticDataTests(SimpleTestCase):
+    def test_batches_reproduce_from_seed(self):
+        self.assertEqual(inverter_batch(7, 3, 300, 50), inverter_batch(7, 3, 300, 50))
+        self.assertNotEqual(inverter_batch(7, 3, 300, 50), inverter_batch(8, 3, 300, 50))
+        self.assertEqual(
+            user_batch(7, 0, 0, 3, iterations=1000), user_batch(7, 0, 0, 3, iterations=1000)
+        )
+
+    def test_user_passwords_verify(self):
+        username, _, encoded = user_batch(7, 0, 4, 1, iterations=1000)[0]
+        self.assertEqual(username, "synthetic4")
+        self.assertTrue(check_password("synthetic-4", encoded))
+
+
+class CatalogCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_catalog_writes_bump_the_version(self):
+        versions = [get_catalog_version()]
+        with self.captureOnCommitCallbacks(execute=True):
+            inverter = make_inverter()
+        versions.append(get_catalog_version())
+        with self.captureOnCommitCallbacks(execute=True):
+            inverter.price = Decimal("1400")
+            inverter.save()
+        versions.append(get_catalog_version())
+        with self.captureOnCommitCallbacks(execute=True):
+            inverter.delete()
+        versions.append(get_catalog_version())
+        with self.captureOnCommitCallbacks(execute=True):
+            HomepageSlider.objects.create(title="Slide", image="slider/s.jpg")
+        versions.append(get_catalog_version())
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_storefront_payload_is_cached_per_version(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_inverter(model="R1")
+        payload = get_storefront_payload()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_storefront_payload(), payload)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            make_inverter(model="R2")
+        columns = json.loads(get_storefront_payload()["products_json"])
+        self.assertEqual(columns["model"], ["R2", "R1"])
+
+
+class BrandSummaryTests(TestCase):
+    def summaries(self):
+        return list(
+            BrandSummary.objects.order_by("brand").values(
+                "brand", "inverter_count", "price_sum", "price_min", "price_max",
+                "power_sum", "power_min", "power_max",
+            )
+        )
+
+    def assertSummariesMatchRecount(self):
+        summaries = self.summaries()
+        refresh_brand_summaries()
+        self.assertEqual(summaries, self.summaries())
+
+    def test_writes_keep_the_summaries_current(self):
+        low = make_inverter(model="R1", price=Decimal("1000"), power_capacity_kw=3)
+        middle = make_inverter(model="R2", price=Decimal("1500"), power_capacity_kw=5)
+        make_inverter(model="R3", price=Decimal("2000"), power_capacity_kw=8)
+        self.assertSummariesMatchRecount()
+
+        middle = Inverter.objects.get(pk=middle.pk)
+        middle.price = "1600"
+        middle.save()
+        self.assertEqual(BrandSummary.objects.get(brand="B").price_sum, Decimal("4600"))
+        self.assertSummariesMatchRecount()
+
+        low = Inverter.objects.get(pk=low.pk)
+        low.brand = "C"
+        low.save()
+        self.assertEqual(
+            BrandSummary.objects.get(brand="B").price_min, Decimal("1600")
+        )
+        self.assertSummariesMatchRecount()
+
+        Inverter.objects.get(pk=middle.pk).delete()
+        low.delete()
+        self.assertFalse(BrandSummary.objects.filter(brand="C").exists())
+        self.assertSummariesMatchRecount()
+
+    def test_saves_without_summary_changes_are_skipped(self):
+        inverter = Inverter.objects.get(pk=make_inverter().pk)
+        inverter.image_status = ImageStatus.FAILED
+        with self.assertNumQueries(1):
+            inverter.save(update_fields=["image_status", "updated_at"])
+        inverter.description = "New text"
+        with self.assertNumQueries(1):
+            inverter.save()
+
+
+@without_static_manifest
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_inverter()
+
+    def test_storefront_answers_304_until_the_catalog_changes(self):
+        response = self.client.get("/")
+        etag = response["ETag"]
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+
+        self.assertEqual(self.client.get("/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            make_inverter(model="R2")
+        response = self.client.get("/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_a_new_release_changes_the_validators(self):
+        response = self.client.get("/")
+        etag = response["ETag"]
+
+        deployed = timezone.now() + timedelta(hours=1)
+        with override_settings(RELEASE="next", RELEASE_TIME=deployed):
+            response = self.client.get("/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response["Last-Modified"], http_date(deployed.timestamp()))
+
+    def test_admin_etag_is_scoped_to_the_user(self):
+        authenticate(self.client)
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = "x" * 32
+        response = self.client.get("/products/")
+        etag = response["ETag"]
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotIn("Last-Modified", response)
+
+        response = self.client.get("/products/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        session = self.client.session
+        session["user_id"] = 1
+        session.save()
+        response = self.client.get("/products/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+@without_static_manifest
+class ProductsAdminTests(TestCase):
+    def setUp(self):
+        authenticate(self.client)
+        Inverter.objects.bulk_create(
+            [
+                Inverter(
+                    name=f"Inverter {i}", brand="B", model=f"M{i:02d}",
+                    power_capacity_kw=i + 1, price=Decimal(100 + i),
+                    input_voltage="48V", output_voltage="230V",
+                    description=f"Full description {i} " + "x" * 300,
+                )
+                for i in range(30)
+            ]
+        )
+
+    def test_list_is_paginated_without_full_descriptions(self):
+        response = self.client.get("/products/", {"sort": "price"})
+        page = response.context["page_obj"]
+        self.assertEqual(page.paginator.count, 30)
+        self.assertEqual([i.model for i in page][:2], ["M00", "M01"])
+        self.assertEqual(len(page), 25)
+        self.assertNotContains(response, "x" * 300)
+
+        response = self.client.get("/products/", {"sort": "price", "page": 2})
+        self.assertEqual([i.model for i in response.context["page_obj"]][-1], "M29")
+
+        # Unknown sort keys fall back to newest first instead of erroring
+        response = self.client.get("/products/", {"sort": "password"})
+        self.assertEqual(response.context["sort"], "-created")
+
+    def test_edit_form_data_is_loaded_per_product(self):
+        inverter = Inverter.objects.get(model="M07")
+        response = self.client.get(f"/products/{inverter.id}/")
+        self.assertEqual(response.json()["description"], inverter.description)
+        self.assertEqual(response.json()["price"], "107.00")
+        self.assertEqual(self.client.get("/products/999999/").status_code, 404)
+
+
+class ProductExportTests(TestCase):
+    def setUp(self):
+        authenticate(self.client)
+        for brand, power in [("A", 3), ("A", 30), ("B", 8)]:
+            make_inverter(brand=brand, model=f"{brand}{power}", power_capacity_kw=power)
+
+    def export(self, **params):
+        response = self.client.get("/products/export/", params)
+        self.assertEqual(response["Cache-Control"], "private, no-store")
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_export_is_filtered_and_reimports(self):
+        content = self.export(format="csv", power_max=10)
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(list(rows[0]), EXPORT_FIELDS)
+        self.assertEqual(sorted(row["model"] for row in rows), ["A3", "B8"])
+
+        report = CatalogImporter().run(io.StringIO(content), "csv")
+        self.assertEqual((report.valid, report.error_count), (2, 0))
+        self.assertEqual(Inverter.objects.count(), 3)
+
+    def test_jsonl_export(self):
+        lines = self.export(format="jsonl", brand="A").splitlines()
+        models = sorted(json.loads(line)["model"] for line in lines)
+        self.assertEqual(models, ["A3", "A30"])
+
+    def test_jsonl_export_flushes_the_first_row(self):
+        response = self.client.get("/products/export/", {"format": "jsonl"})
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+        self.assertEqual(chunks[0].count("\n"), 1)
+        self.assertEqual("".join(chunks).count("\n"), 3)
+
+    @override_settings(CATALOG_IMPORT_MAX_UPLOAD_SIZE=100)
+    def test_admin_import_rejects_files_over_the_cap(self):
+        content = (
+            "name,brand,model,power_capacity_kw,input_voltage,output_voltage,"
+            "price,description\nResidential 5kW,C,C5,5,48V,230V,1500,Text\n"
+        )
+        upload = SimpleUploadedFile("catalog.csv", content.encode(), "text/csv")
+        response = self.client.post("/products/import/", {"catalog_file": upload})
+        self.assertRedirects(response, "/products/", fetch_redirect_response=False)
+        message = str(list(response.wsgi_request._messages)[0])
+        self.assertIn("import_catalog", message)
+        self.assertEqual(Inverter.objects.count(), 3)
+
+    def test_unknown_format_redirects(self):
+        response = self.client.get("/products/export/", {"format": "xlsx"})
+        self.assertRedirects(response, "/products/", fetch_redirect_response=False)
+
+
+class AuthMiddlewareTests(TestCase):
+    def test_public_paths_never_touch_the_session(self):
+        for path in ["/", "/api/inverters/", "/static/app.css", "/login/"]:
+            request = RequestFactory().get(path)
+            request.session = mock.MagicMock()
+            AuthMiddleware(lambda request: HttpResponse())(request)
+            self.assertEqual(request.session.mock_calls, [], path)
+
+        response = self.client.get("/api/inverters/")
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+
+    def test_protected_paths_need_a_login(self):
+        response = self.client.get("/products/", {"page": 2})
+        self.assertRedirects(response, "/login/", fetch_redirect_response=False)
+        self.assertEqual(self.client.session["next"], "/products/?page=2")
+
+        authenticate(self.client)
+        self.assertEqual(self.client.get("/dashboard/").status_code, 200)
+
+
+class StorefrontPayloadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_columnar_payload_without_descriptions(self):
+        common = dict(
+            input_voltage="48V", output_voltage="230V", description="Long text"
+        )
+        Inverter.objects.create(
+            name="Commercial </script> 50kW", brand="A", model="C1",
+            power_capacity_kw=50, price=Decimal("9000"), **common
+        )
+        inverter = Inverter.objects.create(
+            name="Residential 5kW", brand="B", model="R1",
+            power_capacity_kw=5, price=Decimal("1500.50"), **common
+        )
+        self.assertEqual(inverter.icon, "🏠")
+
+        payload = build_storefront_payload()["products_json"]
+        self.assertNotIn("</script>", payload)
+        self.assertNotIn("Long text", payload)
+        columns = json.loads(payload)
+        self.assertEqual(columns["model"], ["R1", "C1"])
+        self.assertEqual(columns["icon"], ["🏠", "🏢"])
+        self.assertEqual(columns["price"], [1500.5, 9000.0])
+        self.assertEqual(columns["image"], ["", ""])
+
+    def test_card_prices_match_the_server_rendered_grid(self):
+        prices = ["1500.50", "999.49", "2499.99", "0.50", "12000.00"]
+        for index, price in enumerate(prices):
+            make_inverter(model=f"P{index}", price=Decimal(price))
+
+        columns = json.loads(build_storefront_payload()["products_json"])
+        # The markup the grid was rendered with before the columnar payload
+        grid = Template("{{ price|floatformat:0 }}")
+        expected = {
+            float(price): grid.render(Context({"price": Decimal(price)}))
+            for price in prices
+        }
+        self.assertEqual(
+            dict(zip(columns["price"], columns["price_label"])), expected
+        )
+
+    @without_static_manifest
+    def test_storefront_does_no_storage_work(self):
+        variants = [
+            {"width": width, "format": fmt, "name": f"inverters/a-{width}w.{fmt}"}
+            for width in (320, 760)
+            for fmt in ("webp", "jpeg")
+        ]
+        inverter = Inverter.objects.create(
+            name="Residential 5kW", brand="B", model="R1", power_capacity_kw=5,
+            price=Decimal("1500"), input_voltage="48V", output_voltage="230V",
+            description="Text", image="inverters/a.png", image_variants=variants,
+        )
+        storage = inverter.image.storage
+        self.assertEqual(inverter.image_url, storage.url("inverters/a-760w.jpeg"))
+        self.assertEqual(inverter.thumbnail_url, storage.url("inverters/a-320w.jpeg"))
+        slider = HomepageSlider.objects.create(title="Slide", image="slider/s.jpg")
+
+        with mock.patch.object(storage, "url") as url:
+            response = self.client.get("/", HTTP_HOST="localhost")
+        self.assertEqual(response.status_code, 200)
+        url.assert_not_called()
+        self.assertContains(response, f"{variants[0]['url']} 320w")
+        self.assertContains(response, f"url('{slider.image_url}')")
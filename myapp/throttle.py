@@ -0,0 +1,118 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def client_ip(request):
+    """
+    The client address as seen by the last of TRUSTED_PROXY_COUNT proxies.
+
+    Each proxy appends the address it received the request from to
+    ``X-Forwarded-For``, so only the right-most entries are trustworthy;
+    anything further left is whatever the client chose to send.
+    """
+    hops = getattr(settings, "TRUSTED_PROXY_COUNT", 0)
+    if hops:
+        forwarded = [
+            ip.strip()
+            for ip in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+            if ip.strip()
+        ]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.META.get("REMOTE_ADDR") or "unknown"
+
+
+class TokenBucket:
+    """
+    One token bucket per identifier, stored in the shared cache.
+
+    A bucket is a ``(tokens, timestamp)`` pair that refills continuously at
+    ``capacity / period`` tokens per second. Entries expire once they would
+    be full again, so idle clients cost nothing.
+    """
+
+    def __init__(self, scope, capacity, period):
+        self.scope = scope
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+
+    def key(self, ident):
+        return f"throttle:{self.scope}:{ident}"
+
+    def level(self, state, now):
+        if state is None:
+            return self.capacity
+        tokens, stamp = state
+        return min(self.capacity, tokens + (now - stamp) * self.rate)
+
+    def retry_after(self, state, now):
+        """
+        Seconds until one token is available, or 0 if one is available now.
+        """
+        missing = 1 - self.level(state, now)
+        return missing / self.rate if missing > 0 else 0
+
+
+class LoginThrottle:
+    """
+    Limit failed logins per client IP and per username.
+
+    ``check`` is a single cache round trip and runs before any user lookup
+    or password hashing, so a locked-out client is turned away cheaply.
+    Concurrent failures can race on the read-modify-write, which at worst
+    lets a burst through by a token or two.
+    """
+
+    def __init__(self, rates=None):
+        rates = rates or settings.LOGIN_THROTTLE_RATES
+        self.buckets = {
+            scope: TokenBucket(f"login:{scope}", capacity, period)
+            for scope, (capacity, period) in rates.items()
+        }
+
+    def idents(self, ip, username):
+        # Hash usernames so arbitrary input makes a safe, bounded cache key
+        user = hashlib.sha256(username.lower().encode()).hexdigest()[:32]
+        keys = {"ip": ip, "username": user}
+        return {
+            self.buckets[scope].key(ident): self.buckets[scope]
+            for scope, ident in keys.items()
+            if scope in self.buckets
+        }
+
+    def check(self, ip, username):
+        """
+        Return how many seconds the caller must wait, or 0 if allowed.
+        """
+        buckets = self.idents(ip, username)
+        states = cache.get_many(list(buckets))
+        now = time.time()
+        return max(
+            (bucket.retry_after(states.get(key), now) for key, bucket in buckets.items()),
+            default=0,
+        )
+
+    def failure(self, ip, username):
+        buckets = self.idents(ip, username)
+        states = cache.get_many(list(buckets))
+        now = time.time()
+        for key, bucket in buckets.items():
+            tokens = max(0, bucket.level(states.get(key), now) - 1)
+            # Expire the entry once the bucket would be full again
+            timeout = (bucket.capacity - tokens) / bucket.rate
+            cache.set(key, (tokens, now), max(1, int(timeout) + 1))
+
+    def success(self, ip, username):
+        # The IP bucket is kept, so one valid account can't reset a spray
+        user_keys = [
+            key for key, bucket in self.idents(ip, username).items()
+            if bucket.scope == "login:username"
+        ]
+        cache.delete_many(user_keys)
+
+
+login_throttle = LoginThrottle()
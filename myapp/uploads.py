@@ -0,0 +1,148 @@
+import logging
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db.models import F
+from django.utils import timezone
+from myapp.images import (
+    INVERTER_IMAGE_WIDTHS,
+    SLIDER_IMAGE_WIDTHS,
+    delete_derivatives,
+    replace_image,
+)
+from myapp.models import HomepageSlider, ImageStatus, ImageUploadJob, Inverter
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+# A claimed job is retried by someone else if it isn't finished by then
+LEASE = timedelta(minutes=5)
+RETRY_DELAY = timedelta(seconds=30)
+
+IMAGE_WIDTHS = {
+    Inverter: INVERTER_IMAGE_WIDTHS,
+    HomepageSlider: SLIDER_IMAGE_WIDTHS,
+}
+
+def queue_image_upload(instance, upload):
+    """
+    Queue ``upload`` for a saved instance and return straight away.
+
+    The caller sets ``image_status`` to pending before saving. Any upload
+    still queued for the same row is dropped, so the newest file wins.
+
+    Storing the image and encoding its derivatives takes seconds, so none
+    of it happens in the admin request: ``process_image_uploads``, run as a
+    worker (``--watch``) or from cron, picks the job up from the database.
+    """
+    label = instance._meta.label_lower
+    ImageUploadJob.objects.filter(model=label, object_id=instance.pk).delete()
+    return ImageUploadJob.objects.create(
+        model=label,
+        object_id=instance.pk,
+        filename=upload.name,
+        data=upload.read(),
+    )
+
+
+def process_job(job_id):
+    """
+    Upload one queued image and record the outcome on its row.
+
+    Returns True when the image was stored. Jobs are claimed with a
+    conditional UPDATE, so a job is never run by two workers at once.
+    """
+    now = timezone.now()
+    claimed = ImageUploadJob.objects.filter(
+        pk=job_id, run_after__lte=now, attempts__lt=MAX_ATTEMPTS
+    ).update(run_after=now + LEASE, attempts=F("attempts") + 1)
+    if not claimed:
+        return False
+
+    job = ImageUploadJob.objects.get(pk=job_id)
+    model = apps.get_model(job.model)
+    try:
+        instance = model.objects.get(pk=job.object_id)
+    except model.DoesNotExist:
+        job.delete()
+        return False
+
+    old_name = instance.image.name
+    old_variants = instance.image_variants
+    try:
+        upload = ContentFile(bytes(job.data), name=job.filename)
+        replace_image(instance, upload, IMAGE_WIDTHS[model])
+        instance.image_status = ImageStatus.READY
+        instance.save(
+            update_fields=["image", "image_variants", "image_status", "updated_at"]
+        )
+    except Exception as e:
+        # Nothing points at files stored by this attempt, so remove them
+        discard_files(instance, old_name)
+        instance.image.name = old_name
+        instance.image_variants = old_variants
+        record_failure(job, instance, e)
+        return False
+
+    job.delete()
+    logger.info(f"Image uploaded for {job.model} {job.object_id}: {instance.image.name}")
+
+    # The row points at the new files now, so the old ones can go
+    delete_derivatives(instance.image.storage, old_variants)
+    if old_name and old_name != instance.image.name:
+        try:
+            instance.image.storage.delete(old_name)
+        except Exception as e:
+            logger.warning(f"Old image couldn't be deleted: {str(e)}")
+    return True
+
+
+def discard_files(instance, old_name):
+    if not instance.image or instance.image.name == old_name:
+        return
+    delete_derivatives(instance.image.storage, instance.image_variants)
+    try:
+        instance.image.storage.delete(instance.image.name)
+    except Exception as e:
+        logger.warning(f"Failed upload's image couldn't be deleted: {str(e)}")
+
+
+def record_failure(job, instance, error):
+    logger.error(
+        f"Image upload for {job.model} {job.object_id} failed "
+        f"(attempt {job.attempts}): {str(error)}"
+    )
+    job.last_error = str(error)
+    if job.attempts >= MAX_ATTEMPTS:
+        job.save(update_fields=["last_error"])
+        instance.image_status = ImageStatus.FAILED
+        instance.save(update_fields=["image_status", "updated_at"])
+        return
+
+    delay = RETRY_DELAY * 2 ** (job.attempts - 1)
+    job.run_after = timezone.now() + delay
+    # Picked up by the next process_image_uploads run after this time
+    job.save(update_fields=["last_error", "run_after"])
+
+
+def due_jobs():
+    return ImageUploadJob.objects.filter(
+        run_after__lte=timezone.now(), attempts__lt=MAX_ATTEMPTS
+    ).order_by("run_after")
+
+
+def retry_failed_jobs():
+    """
+    Give jobs that used up their attempts another full round.
+    """
+    failed = list(ImageUploadJob.objects.filter(attempts__gte=MAX_ATTEMPTS))
+    for job in failed:
+        model = apps.get_model(job.model)
+        model.objects.filter(pk=job.object_id).update(
+            image_status=ImageStatus.PENDING
+        )
+    ImageUploadJob.objects.filter(pk__in=[job.pk for job in failed]).update(
+        attempts=0, run_after=timezone.now()
+    )
+    return len(failed)
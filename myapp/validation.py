@@ -0,0 +1,52 @@
+from myapp.models import Inverter
+
+REQUIRED_INVERTER_FIELDS = [
+    "name",
+    "brand",
+    "model",
+    "power_capacity_kw",
+    "input_voltage",
+    "output_voltage",
+    "price",
+    "description",
+]
+
+
+def validate_inverter_data(data, files=None, check_unique=False, instance_id=None):
+    """
+    Validate inverter fields; shared by the admin forms and the bulk importer.
+
+    With ``check_unique`` another inverter with the same brand and model is
+    an error too (``instance_id`` is the one being edited). The importer
+    leaves it off, as it updates existing products in place.
+    """
+    errors = []
+
+    for field in REQUIRED_INVERTER_FIELDS:
+        if not data.get(field):
+            errors.append(f"{field.replace('_', ' ').title()} is required.")
+
+    # Check numeric fields
+    for num_field in ["price", "power_capacity_kw"]:
+        try:
+            float(data.get(num_field))
+        except (ValueError, TypeError):
+            errors.append(f"{num_field.replace('_', ' ').title()} must be a number.")
+
+    # Validate image (optional)
+    image = files.get("image") if files else None
+    if image:
+        if image.size > 5 * 1024 * 1024:  # 5MB max
+            errors.append("Image size must be less than 5MB.")
+
+    if check_unique and data.get("brand") and data.get("model"):
+        duplicates = Inverter.objects.filter(brand=data["brand"], model=data["model"])
+        if instance_id is not None:
+            duplicates = duplicates.exclude(id=instance_id)
+        if duplicates.exists():
+            errors.append(
+                f"An inverter with brand {data['brand']} and model "
+                f"{data['model']} already exists."
+            )
+
+    return errors
@@ -0,0 +1,13 @@
+"""
+Path prefixes that need a logged-in admin session.
+
+AuthMiddleware compiles this table once at startup; requests outside it
+never touch the session. Keep it in step with the admin routes in urls.py.
+"""
+
+PROTECTED_PATH_PREFIXES = [
+    "/dashboard",
+    "/products/",
+    "/slider/",
+    # "/registeruser/",
+]
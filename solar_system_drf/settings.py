@@ -1,5 +1,7 @@
+from datetime import datetime, timezone as dt_timezone
 from pathlib import Path
 import os
+import time
 
 # Add these at the top of your settings.py
 from dotenv import load_dotenv
@@ -64,17 +66,22 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
-    "rest_framework",
+    "django.contrib.postgres",
     "myapp",
-    "cloudinary",
-    "cloudinary_storage",
 ]
+# Kept out of INSTALLED_APPS to keep cold starts lean:
+# - rest_framework: the API renders JSON only, so the app's templates aren't
+#   needed, and its template tags would import DRF (and requests) on the
+#   first page render
+# - cloudinary, cloudinary_storage: only media storage uses them, and Django
+#   imports that on first use (see DEFAULT_FILE_STORAGE below)
 
 
 # Whitenoise configuration
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "myapp.middleware.page_cache.AnonymousPageCacheMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -84,6 +91,17 @@ MIDDLEWARE = [
     "myapp.middleware.auth_middleware.AuthMiddleware",
 ]
 
+# Opt-in database connect versus query timing in a Server-Timing header and
+# slow-connect warnings in the logs (see myapp.middleware.db_timing). Off by
+# default: it wraps every query and shows backend timings to any client.
+DB_TIMING = os.getenv("DB_TIMING", "False").lower() in ("true", "1")
+if DB_TIMING:
+    # First, so connects made by the session and auth middleware count too
+    MIDDLEWARE.insert(0, "myapp.middleware.db_timing.DatabaseTimingMiddleware")
+
+# Path prefixes AuthMiddleware guards, declared next to urls.py
+PROTECTED_ROUTES = "solar_system_drf.protected_routes.PROTECTED_PATH_PREFIXES"
+
 # For WhiteNoise: enables efficient static file serving
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
@@ -97,17 +115,40 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "myapp/templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            # Keep compiled templates in memory per process, whatever DEBUG
+            # says; runserver's autoreloader still clears it on template edits
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
         },
     },
 ]
 
+# Opt-in per-request profiling (query count, SQL, template and view time in
+# Server-Timing and the logs, plus N+1 warnings); see myapp/profiling.py
+REQUEST_PROFILING = os.getenv("REQUEST_PROFILING", "False").lower() in ("true", "1")
+# A SQL shape repeated more often than this in one request is logged as N+1
+REQUEST_PROFILE_REPEAT_THRESHOLD = int(os.getenv("REQUEST_PROFILE_REPEAT_THRESHOLD", "5"))
+if REQUEST_PROFILING:
+    # The DB timing layer times the queries for both, once per query
+    if not DB_TIMING:
+        DB_TIMING = True
+        MIDDLEWARE.insert(0, "myapp.middleware.db_timing.DatabaseTimingMiddleware")
+    MIDDLEWARE.append("myapp.middleware.request_profile.RequestProfileMiddleware")
+    TEMPLATES[0]["BACKEND"] = "myapp.profiling.ProfiledDjangoTemplates"
+
 
 WSGI_APPLICATION = "solar_system_drf.wsgi.application"
 
@@ -139,7 +180,8 @@ tmpPostgres = urlparse(os.getenv("DATABASE_URL"))
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        # Stock PostgreSQL backend plus connect timing and optional pooling
+        "ENGINE": "myapp.db_backend",
         "NAME": tmpPostgres.path.replace("/", ""),
         "USER": tmpPostgres.username,
         "PASSWORD": tmpPostgres.password,
@@ -149,10 +191,127 @@ DATABASES = {
     }
 }
 
+# Server-side cursors (used by the catalog export) don't survive a
+# transaction-mode pooler such as Neon's "-pooler" endpoints; there Django
+# fetches each iterator() result client-side instead
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = os.getenv(
+    "DB_DISABLE_SERVER_SIDE_CURSORS",
+    str("-pooler" in (tmpPostgres.hostname or "")),
+).lower() in ("true", "1")
+
+# Connection reuse, chosen with DB_CONN_POLICY:
+#   persistent  - keep the connection open across requests for
+#                 DB_CONN_MAX_AGE seconds, checked before reuse (default)
+#   pool        - return connections to an in-process pool at the end of each
+#                 request, shared with background threads (DB_POOL_SIZE idle)
+#   per-request - open and close a connection for every request
+DB_CONN_POLICY = os.getenv("DB_CONN_POLICY", "persistent")
+if DB_CONN_POLICY == "persistent":
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+elif DB_CONN_POLICY == "pool":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["POOL"] = {
+        "max_idle": int(os.getenv("DB_POOL_SIZE", "4")),
+        "health_check_after": 30,
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+
+
+# Cache
+# Set REDIS_URL in production so every serverless instance shares one cache
+# and sees catalog invalidations immediately. Without it each process keeps
+# its own in-memory cache, so cached catalog payloads get a finite lifetime.
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+    CATALOG_CACHE_TIMEOUT = None
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "solar-system",
+        }
+    }
+    CATALOG_CACHE_TIMEOUT = int(os.getenv("CATALOG_CACHE_TIMEOUT", "300"))
+
+# The deployed build. It is part of the catalog ETag and cache keys, so a
+# deploy that only changes templates or static files isn't answered with
+# 304s or cached pages from the previous release. Vercel sets the commit SHA.
+RELEASE = os.getenv("RELEASE") or os.getenv("VERCEL_GIT_COMMIT_SHA", "")
+# Catalog pages never claim a Last-Modified before this. RELEASE_TIME is the
+# deploy time as a Unix timestamp; without it the process start is used.
+RELEASE_TIME = datetime.fromtimestamp(
+    float(os.getenv("RELEASE_TIME") or time.time()), tz=dt_timezone.utc
+)
+
+
+# Largest supplier file the products page imports within a request; bigger
+# catalogs go through the import_catalog management command
+CATALOG_IMPORT_MAX_UPLOAD_SIZE = int(
+    os.getenv("CATALOG_IMPORT_MAX_UPLOAD_SIZE", str(2 * 1024 * 1024))
+)
+
+
+# Anonymous full-page cache (see myapp.middleware.page_cache)
+# After the soft TTL the stale copy is still served while a background thread
+# re-renders the page; the hard TTL is how long an entry may live in
+# the cache. Only the query parameters listed here get their own entries.
+PAGE_CACHE_PATHS = ["/"]
+PAGE_CACHE_QUERY_PARAMS = []
+PAGE_CACHE_SOFT_TTL = int(os.getenv("PAGE_CACHE_SOFT_TTL", "60"))
+PAGE_CACHE_HARD_TTL = int(os.getenv("PAGE_CACHE_HARD_TTL", "3600"))
+
+
+# Sessions
+# SESSION_MODE picks the backend (compare them with `manage.py benchmark_sessions`):
+#   db             - one database read per request, plus a write when modified
+#   cached_db      - reads served from the cache, writes go to both; with
+#                    REDIS_URL the cache survives cold starts (default there)
+#   signed_cookies - no server-side storage at all; sessions can't be revoked
+#                    before they expire, so keep the admin session short
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+SESSION_MODE = os.getenv("SESSION_MODE", "cached_db" if REDIS_URL else "db")
+SESSION_ENGINE = SESSION_ENGINES[SESSION_MODE]
+
+
+# Login throttle (see myapp.throttle): token buckets of (capacity, seconds to
+# refill completely), one per client IP and one per username. Only failed
+# logins spend tokens. Needs REDIS_URL to be shared across instances.
+LOGIN_THROTTLE_RATES = {
+    "ip": (20, 15 * 60),
+    "username": (5, 15 * 60),
+}
+# Proxies in front of the app that append to X-Forwarded-For (Vercel's edge
+# is one); the client IP is read that many entries from the right. With 0,
+# REMOTE_ADDR is used.
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "1"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
+# Password hashing
+# PBKDF2 cost is sized for the deployment CPU with `manage.py calibrate_hashers`.
+# Stored hashes at a different cost are rehashed on the next login.
+PASSWORD_HASHERS = [
+    "myapp.hashers.TunedPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "0")) or None
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -217,5 +376,9 @@ LOGGING = {
 
 CLOUDINARY_URL = os.getenv("CLOUDINARY_URL")
 
-DEFAULT_FILE_STORAGE = "cloudinary_storage.storage.MediaCloudinaryStorage"
+if CLOUDINARY_URL:
+    DEFAULT_FILE_STORAGE = "cloudinary_storage.storage.MediaCloudinaryStorage"
+else:
+    # Local stand-in for development and tests, served from MEDIA_URL in DEBUG
+    DEFAULT_FILE_STORAGE = "django.core.files.storage.FileSystemStorage"
 
@@ -1,32 +1,70 @@
 from django.contrib import admin
 from django.urls import path, include
 from myapp import views
-from myapp.ADMIN.dashboard import Dashboard
-from myapp.ADMIN.products import Products
-from myapp.ADMIN import registeruser
-from myapp.ADMIN.registeruser import deleteuser
-from myapp.ADMIN import home
-from myapp.ADMIN import login
+from myapp.lazyviews import lazy_view
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import HttpResponse  # Fixed typo
 
+# Admin and API views are imported on their first request (see lazy_view),
+# so a cold start that serves the storefront doesn't load them
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", views.index, name="index"),
+    # Public catalog API
+    path(
+        "api/inverters/",
+        lazy_view("myapp.API.inverters.InverterList"),
+        name="api-inverters",
+    ),
+    path(
+        "api/inverters/search/",
+        lazy_view("myapp.API.inverters.InverterSearch"),
+        name="api-inverter-search",
+    ),
+    path(
+        "api/inverters/<int:pk>/",
+        lazy_view("myapp.API.inverters.InverterDetail"),
+        name="api-inverter-detail",
+    ),
     # ADMIN URLS
     # Login URL
-    path("login/", login.loginuser, name="login"),
-    path("logout/", login.logoutuser, name="logout"),
-    path("dashboard/", Dashboard.as_view(), name="dashboard"),
-    path("products/", Products.as_view(), name="products"),
-    path("products/update/", Products.as_view(), name="productsupdate"),
+    path("login/", lazy_view("myapp.ADMIN.login.loginuser"), name="login"),
+    path("logout/", lazy_view("myapp.ADMIN.login.logoutuser"), name="logout"),
+    path("dashboard/", lazy_view("myapp.ADMIN.dashboard.Dashboard"), name="dashboard"),
+    path("products/", lazy_view("myapp.ADMIN.products.Products"), name="products"),
+    path(
+        "products/update/",
+        lazy_view("myapp.ADMIN.products.Products"),
+        name="productsupdate",
+    ),
+    path(
+        "products/<int:id>/",
+        lazy_view("myapp.ADMIN.products.ProductDetail"),
+        name="productdetail",
+    ),
+    path(
+        "products/import/",
+        lazy_view("myapp.ADMIN.productimport.ProductImport"),
+        name="productimport",
+    ),
+    path(
+        "products/export/",
+        lazy_view("myapp.ADMIN.productexport.ProductExport"),
+        name="productexport",
+    ),
     # Slider management URLs - FIXED
-    path("slider/", home.homepage, name="homepage"),
+    path("slider/", lazy_view("myapp.ADMIN.home.homepage"), name="homepage"),
     # users
-    path("registeruser/", registeruser.registeruser, name="registeruser"),
     path(
-        "deleteuser/<int:id>/", deleteuser, name="deleteuser"
+        "registeruser/",
+        lazy_view("myapp.ADMIN.registeruser.registeruser"),
+        name="registeruser",
+    ),
+    path(
+        "deleteuser/<int:id>/",
+        lazy_view("myapp.ADMIN.registeruser.deleteuser"),
+        name="deleteuser",
     ),  # ✅ now it’s a function
 ]
 if settings.DEBUG: